@@ -1,5 +1,6 @@
 """Port for credential repository - driven/secondary port."""
 
+from collections.abc import AsyncIterator
 from typing import Protocol
 
 from ...domain.entities import Credential
@@ -24,3 +25,18 @@ class CredentialRepository(Protocol):
             CredentialRepositoryError: If retrieval fails.
         """
         ...
+
+    def get_credentials_stream(self) -> AsyncIterator[Credential]:
+        """
+        Stream all credentials from the identity provider.
+
+        Unlike get_all_credentials, credentials are yielded as they are
+        retrieved so callers can filter them without holding the full set.
+
+        Yields:
+            Credentials across all applications.
+
+        Raises:
+            CredentialRepositoryError: If retrieval fails.
+        """
+        ...
@@ -1,9 +1,12 @@
 """Use case for checking and reporting expiring credentials."""
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
+from datetime import UTC, datetime
 
-from ...domain.entities import ExpirationReport
+from ...domain.entities import Credential, ExpirationReport, set_reference_now
 from ...domain.services import ExpirationAnalyzer
 from ...domain.value_objects import ExpirationThresholds
 from ..ports import CredentialRepository, NotificationSender
@@ -52,7 +55,9 @@ class CheckExpiringCredentials:
             dry_run: If True, don't actually send notifications.
         """
         self._repository = credential_repository
-        self._senders = [s for s in notification_senders if s.is_configured()]
+        self._senders: tuple[tuple[NotificationSender, str], ...] = tuple(
+            (s, type(s).__name__) for s in notification_senders if s.is_configured()
+        )
         self._analyzer = ExpirationAnalyzer(thresholds)
         self._dry_run = dry_run
 
@@ -65,12 +70,18 @@ class CheckExpiringCredentials:
         """
         logger.info("Starting credential expiration check...")
 
-        # Retrieve all credentials from the repository
-        credentials = await self._repository.get_all_credentials()
-        logger.info("Retrieved %d credentials", len(credentials))
+        retrieved = 0
+
+        async def count_retrieved() -> AsyncIterator[Credential]:
+            nonlocal retrieved
+            async for credential in self._repository.get_credentials_stream():
+                retrieved += 1
+                yield credential
 
-        # Analyze credentials using domain service
-        report = self._analyzer.analyze(credentials)
+        # Stream credentials into the domain analyzer, evaluated against a single point in time
+        with set_reference_now(datetime.now(UTC)):
+            report = await self._analyzer.analyze_stream(count_retrieved())
+        logger.info("Retrieved %d credentials", retrieved)
         logger.info("Analysis complete: %s", report.get_summary())
 
         # Send notifications if needed
@@ -98,23 +109,26 @@ class CheckExpiringCredentials:
         )
 
     async def _send_notifications(self, report: ExpirationReport) -> tuple[int, int]:
-        """Send notifications through all configured senders."""
-        sent = 0
-        failed = 0
+        """Send notifications through all configured senders concurrently."""
+        results = await asyncio.gather(
+            *(self._safe_send(sender, name, report) for sender, name in self._senders)
+        )
 
-        for sender in self._senders:
-            try:
-                if await sender.send(report):
-                    sent += 1
-                    logger.info("Notification sent via %s", sender.__class__.__name__)
-                else:
-                    failed += 1
-                    logger.warning("Notification failed via %s", sender.__class__.__name__)
-            except Exception:
-                failed += 1
-                logger.exception("Error sending notification via %s", sender.__class__.__name__)
-
-        return sent, failed
+        sent = sum(1 for _, success in results if success)
+        return sent, len(results) - sent
+
+    async def _safe_send(
+        self, sender: NotificationSender, name: str, report: ExpirationReport
+    ) -> tuple[str, bool]:
+        """Send a notification through a single sender without raising."""
+        try:
+            if await sender.send(report):
+                logger.info("Notification sent via %s", name)
+                return name, True
+            logger.warning("Notification failed via %s", name)
+        except Exception:
+            logger.exception("Error sending notification via %s", name)
+        return name, False
 
     def _log_dry_run_report(self, report: ExpirationReport) -> None:
         """Log report details in dry run mode."""
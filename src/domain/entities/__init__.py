@@ -1,11 +1,12 @@
 """Domain entities - Objects with identity and lifecycle."""
 
 from .application import Application
-from .credential import Credential
+from .credential import Credential, set_reference_now
 from .expiration_report import ExpirationReport
 
 __all__ = [
     "Application",
     "Credential",
     "ExpirationReport",
+    "set_reference_now",
 ]
@@ -3,22 +3,47 @@
 from dataclasses import dataclass, field
 from uuid import UUID
 
+from ..value_objects import ExpirationThresholds
 from .credential import Credential
 
 
 @dataclass(slots=True)
 class Application:
-    """An Entra ID application registration."""
+    """
+    An Entra ID application registration.
+
+    Credentials are held as a tuple so that every addition goes through
+    add_credential, which keeps the most urgent expiry up to date.
+    """
 
     id: UUID
     display_name: str
-    credentials: list[Credential] = field(default_factory=list)
+    credentials: tuple[Credential, ...] = ()
+    thresholds: ExpirationThresholds = field(default_factory=ExpirationThresholds)
+
+    _min_days_until_expiry: int | None = field(init=False, repr=False, compare=False, default=None)
+
+    def __post_init__(self) -> None:
+        """Track the most urgent of the initial credentials."""
+        self.credentials = tuple(self.credentials)
+        for credential in self.credentials:
+            self._track(credential)
 
     @property
     def has_expiring_credentials(self) -> bool:
         """Check if application has any credentials requiring attention."""
-        return any(cred.is_expired or cred.days_until_expiry <= 90 for cred in self.credentials)
+        return (
+            self._min_days_until_expiry is not None
+            and self._min_days_until_expiry <= self.thresholds.info
+        )
 
     def add_credential(self, credential: Credential) -> None:
         """Add a credential to this application."""
-        self.credentials.append(credential)
+        self.credentials = (*self.credentials, credential)
+        self._track(credential)
+
+    def _track(self, credential: Credential) -> None:
+        """Update the minimum days until expiry with a new credential."""
+        days = credential.days_until_expiry
+        if self._min_days_until_expiry is None or days < self._min_days_until_expiry:
+            self._min_days_until_expiry = days
@@ -1,7 +1,12 @@
 """Credential entity representing a secret or certificate."""
 
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Self
 from uuid import UUID
 
@@ -12,8 +17,33 @@ from ..value_objects import (
     ExpirationThresholds,
 )
 
+_SECONDS_PER_DAY = 86400
 
-@dataclass(slots=True)
+_reference_timestamp: ContextVar[float | None] = ContextVar("reference_timestamp", default=None)
+
+
+@lru_cache(maxsize=4096)
+def _parse_uuid(value: str) -> UUID:
+    """Parse a UUID string, caching IDs shared by many credentials."""
+    return UUID(value)
+
+
+@contextmanager
+def set_reference_now(now: datetime) -> Iterator[None]:
+    """
+    Evaluate all credentials created in this context against a single instant.
+
+    Args:
+        now: Timezone-aware reference time used instead of the current time.
+    """
+    token = _reference_timestamp.set(now.timestamp())
+    try:
+        yield
+    finally:
+        _reference_timestamp.reset(token)
+
+
+@dataclass(slots=True, frozen=True)
 class Credential:
     """A credential (secret or certificate) belonging to an application or service principal."""
 
@@ -26,18 +56,20 @@ class Credential:
     source: CredentialSource = CredentialSource.APP_REGISTRATION
     object_id: UUID | None = None  # Service principal object ID (different from app ID)
 
-    _days_until_expiry: int = field(init=False, repr=False)
-    _is_expired: bool = field(init=False, repr=False)
+    # Derived from the reference time, so they take no part in equality or hashing
+    _days_until_expiry: int = field(init=False, repr=False, compare=False)
+    _is_expired: bool = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Calculate derived fields."""
-        now = datetime.now(UTC)
-        expiry_aware = (
-            self.expiry_date if self.expiry_date.tzinfo else self.expiry_date.replace(tzinfo=UTC)
-        )
-        delta = expiry_aware - now
-        self._days_until_expiry = delta.days
-        self._is_expired = delta.total_seconds() < 0
+        now = _reference_timestamp.get()
+        if now is None:
+            now = time.time()
+        expiry = self.expiry_date
+        expiry_aware = expiry if expiry.tzinfo else expiry.replace(tzinfo=UTC)
+        remaining = expiry_aware.timestamp() - now
+        object.__setattr__(self, "_days_until_expiry", int(remaining // _SECONDS_PER_DAY))
+        object.__setattr__(self, "_is_expired", remaining < 0)
 
     @property
     def days_until_expiry(self) -> int:
@@ -89,15 +121,18 @@ class Credential:
         application_name: str,
         source: CredentialSource = CredentialSource.APP_REGISTRATION,
         object_id: str | None = None,
+        reference_now: datetime | None = None,
     ) -> Self:
         """Factory method to create a Credential from raw data."""
-        return cls(
-            id=UUID(credential_id),
-            credential_type=credential_type,
-            display_name=display_name,
-            expiry_date=expiry_date,
-            application_id=UUID(application_id),
-            application_name=application_name,
-            source=source,
-            object_id=UUID(object_id) if object_id else None,
-        )
+        context = set_reference_now(reference_now) if reference_now is not None else nullcontext()
+        with context:
+            return cls(
+                id=UUID(credential_id),
+                credential_type=credential_type,
+                display_name=display_name,
+                expiry_date=expiry_date,
+                application_id=_parse_uuid(application_id),
+                application_name=application_name,
+                source=source,
+                object_id=_parse_uuid(object_id) if object_id else None,
+            )
@@ -1,8 +1,13 @@
 """Expiration report aggregate root."""
 
+from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from operator import attrgetter
+from typing import Self
 
+from ..exceptions import CredentialNotFoundError
 from ..value_objects import (
     CredentialSource,
     ExpirationStatus,
@@ -11,6 +16,10 @@ from ..value_objects import (
 )
 from .credential import Credential
 
+_SourceStatus = tuple[CredentialSource, ExpirationStatus]
+_URGENCY_KEY = attrgetter("days_until_expiry")
+_ATTENTION_STATUSES = tuple(status for status in ExpirationStatus if status.requires_attention)
+
 
 @dataclass(slots=True)
 class ExpirationReport:
@@ -20,36 +29,110 @@ class ExpirationReport:
     thresholds: ExpirationThresholds
     generated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
-    _categorized: dict[ExpirationStatus, list[Credential]] = field(
+    # Buckets are stored as tuples and accessors hand out list copies, so callers cannot
+    # corrupt them for later readers
+    _expired: tuple[Credential, ...] = field(init=False, repr=False, default=())
+    _critical: tuple[Credential, ...] = field(init=False, repr=False, default=())
+    _warning: tuple[Credential, ...] = field(init=False, repr=False, default=())
+    _healthy: tuple[Credential, ...] = field(init=False, repr=False, default=())
+    _status_by_credential: dict[Credential, ExpirationStatus] = field(
+        init=False, repr=False, default_factory=dict
+    )
+    _by_source: dict[CredentialSource, tuple[Credential, ...]] = field(
+        init=False, repr=False, default_factory=dict
+    )
+    _by_source_status: dict[_SourceStatus, tuple[Credential, ...]] = field(
         init=False, repr=False, default_factory=dict
     )
+    _sorted_by_urgency: tuple[Credential, ...] | None = field(init=False, repr=False, default=None)
+    _categorized_ready: bool = field(init=False, repr=False, default=False)
+    _needs_attention: bool = field(init=False, repr=False, default=False)
 
     def __post_init__(self) -> None:
-        """Categorize credentials by status."""
-        self._categorized = {status: [] for status in ExpirationStatus}
-        for credential in self.credentials:
-            status = credential.get_status(self.thresholds)
-            self._categorized[status].append(credential)
+        """Determine whether any credential requires attention."""
+        thresholds = self.thresholds
+        self._needs_attention = any(
+            c.get_status(thresholds).requires_attention for c in self.credentials
+        )
+
+    @classmethod
+    def from_categorized(
+        cls,
+        categorized: Iterable[tuple[Credential, ExpirationStatus]],
+        thresholds: ExpirationThresholds,
+    ) -> Self:
+        """
+        Build a report from credentials whose statuses are already known.
+
+        Args:
+            categorized: Credentials paired with their status for ``thresholds``.
+            thresholds: Thresholds the statuses were computed with.
+
+        Returns:
+            ExpirationReport that reuses the given statuses instead of recomputing them.
+        """
+        pairs = list(categorized)
+        report = cls(credentials=[], thresholds=thresholds)
+        report.credentials = [credential for credential, _ in pairs]
+        report._index(pairs)
+        return report
+
+    def _categorize(self) -> None:
+        """Categorize credentials by status and source, once."""
+        if not self._categorized_ready:
+            thresholds = self.thresholds
+            self._index((c, c.get_status(thresholds)) for c in self.credentials)
+
+    def _index(self, categorized: Iterable[tuple[Credential, ExpirationStatus]]) -> None:
+        """Build the status and source buckets in a single pass."""
+        expired: list[Credential] = []
+        critical: list[Credential] = []
+        warning: list[Credential] = []
+        healthy: list[Credential] = []
+        by_source: defaultdict[CredentialSource, list[Credential]] = defaultdict(list)
+        by_source_status: defaultdict[_SourceStatus, list[Credential]] = defaultdict(list)
+        for credential, status in categorized:
+            self._status_by_credential[credential] = status
+            if status is ExpirationStatus.EXPIRED:
+                expired.append(credential)
+            elif status is ExpirationStatus.CRITICAL:
+                critical.append(credential)
+            elif status is ExpirationStatus.WARNING:
+                warning.append(credential)
+            else:
+                healthy.append(credential)
+            by_source[credential.source].append(credential)
+            by_source_status[credential.source, status].append(credential)
+        self._by_source = {key: tuple(bucket) for key, bucket in by_source.items()}
+        self._by_source_status = {key: tuple(bucket) for key, bucket in by_source_status.items()}
+        self._expired, self._critical = tuple(expired), tuple(critical)
+        self._warning, self._healthy = tuple(warning), tuple(healthy)
+        self._needs_attention = bool(expired or critical or warning)
+        self._categorized_ready = True
 
     @property
     def expired(self) -> list[Credential]:
         """Get all expired credentials."""
-        return self._categorized[ExpirationStatus.EXPIRED]
+        self._categorize()
+        return list(self._expired)
 
     @property
     def critical(self) -> list[Credential]:
         """Get credentials in critical state."""
-        return self._categorized[ExpirationStatus.CRITICAL]
+        self._categorize()
+        return list(self._critical)
 
     @property
     def warning(self) -> list[Credential]:
         """Get credentials in warning state."""
-        return self._categorized[ExpirationStatus.WARNING]
+        self._categorize()
+        return list(self._warning)
 
     @property
     def healthy(self) -> list[Credential]:
         """Get healthy credentials."""
-        return self._categorized[ExpirationStatus.HEALTHY]
+        self._categorize()
+        return list(self._healthy)
 
     @property
     def expired_count(self) -> int:
@@ -79,78 +162,93 @@ class ExpirationReport:
     @property
     def affected_applications_count(self) -> int:
         """Count of unique applications with credentials requiring attention."""
-        requiring_attention = [
-            c for c in self.credentials if c.get_status(self.thresholds).requires_attention
-        ]
-        return len({c.application_id for c in requiring_attention})
+        self._categorize()
+        return len(
+            {
+                c.application_id
+                for bucket in (self._expired, self._critical, self._warning)
+                for c in bucket
+            }
+        )
 
     @property
     def notification_level(self) -> NotificationLevel:
         """Determine the overall notification level for this report."""
-        if self.expired or self.critical:
+        self._categorize()
+        if self._expired or self._critical:
             return NotificationLevel.CRITICAL
-        if self.warning:
+        if self._warning:
             return NotificationLevel.WARNING
         return NotificationLevel.INFO
 
     @property
     def requires_notification(self) -> bool:
         """Check if this report warrants sending a notification."""
-        return bool(self.expired or self.critical or self.warning)
+        return self._needs_attention
 
     def get_summary(self) -> str:
         """Generate a human-readable summary of the report."""
-        parts: list[str] = []
-        if self.expired_count:
-            parts.append(f"{self.expired_count} expired")
-        if self.critical_count:
-            parts.append(f"{self.critical_count} critical")
-        if self.warning_count:
-            parts.append(f"{self.warning_count} warning")
-        if self.healthy_count:
-            parts.append(f"{self.healthy_count} healthy")
-
-        total_attention = self.expired_count + self.critical_count + self.warning_count
-        if not total_attention:
+        if not self._needs_attention:
             return "All credentials are healthy"
 
-        return f"{total_attention} credentials requiring attention: {', '.join(parts)}"
+        self._categorize()
+        expired, critical, warning = len(self._expired), len(self._critical), len(self._warning)
+        counts = (
+            (expired, "expired"),
+            (critical, "critical"),
+            (warning, "warning"),
+            (len(self._healthy), "healthy"),
+        )
+        parts = ", ".join(f"{count} {label}" for count, label in counts if count)
+        return f"{expired + critical + warning} credentials requiring attention: {parts}"
 
     def get_credentials_sorted_by_urgency(self) -> list[Credential]:
-        """Get all credentials sorted by urgency (most urgent first)."""
-        return sorted(self.credentials, key=lambda c: c.days_until_expiry)
+        """Get all credentials sorted by urgency (most urgent first), sorting once."""
+        if self._sorted_by_urgency is None:
+            self._sorted_by_urgency = tuple(sorted(self.credentials, key=_URGENCY_KEY))
+        return list(self._sorted_by_urgency)
+
+    def get_status(self, credential: Credential) -> ExpirationStatus:
+        """
+        Get the status already computed for a credential of this report.
+
+        Raises:
+            CredentialNotFoundError: If the credential is not part of this report.
+        """
+        self._categorize()
+        try:
+            return self._status_by_credential[credential]
+        except KeyError:
+            msg = f"Credential {credential.id} is not part of this report"
+            raise CredentialNotFoundError(msg) from None
 
     def get_credentials_by_source(self, source: CredentialSource) -> list[Credential]:
         """Get credentials filtered by source."""
-        return [c for c in self.credentials if c.source == source]
+        self._categorize()
+        return list(self._by_source.get(source, ()))
 
     def get_credentials_by_source_and_status(
         self, source: CredentialSource, status: ExpirationStatus
     ) -> list[Credential]:
         """Get credentials filtered by source and status."""
-        return [
-            c
-            for c in self.credentials
-            if c.source == source and c.get_status(self.thresholds) == status
-        ]
+        self._categorize()
+        return list(self._by_source_status.get((source, status), ()))
 
     def has_credentials_for_source(self, source: CredentialSource) -> bool:
         """Check if there are credentials requiring attention for a source."""
-        return any(
-            c.source == source and c.get_status(self.thresholds).requires_attention
-            for c in self.credentials
-        )
+        self._categorize()
+        by_source_status = self._by_source_status
+        return any((source, status) in by_source_status for status in _ATTENTION_STATUSES)
 
     def get_source_summary(self, source: CredentialSource) -> str:
         """Generate a summary for a specific source."""
-        creds = self.get_credentials_by_source(source)
-        if not creds:
+        self._categorize()
+        if source not in self._by_source:
             return f"No {source.display_name} credentials"
 
-        thresholds = self.thresholds
-        expired = sum(1 for c in creds if c.get_status(thresholds) == ExpirationStatus.EXPIRED)
-        critical = sum(1 for c in creds if c.get_status(thresholds) == ExpirationStatus.CRITICAL)
-        warning = sum(1 for c in creds if c.get_status(thresholds) == ExpirationStatus.WARNING)
+        expired = self._count(source, ExpirationStatus.EXPIRED)
+        critical = self._count(source, ExpirationStatus.CRITICAL)
+        warning = self._count(source, ExpirationStatus.WARNING)
 
         parts: list[str] = []
         if expired:
@@ -168,17 +266,15 @@ class ExpirationReport:
 
     def get_source_counts(self, source: CredentialSource) -> dict[str, int]:
         """Get credential counts for a specific source."""
-        creds = self.get_credentials_by_source(source)
-        thresholds = self.thresholds
-        expired = sum(1 for c in creds if c.get_status(thresholds) == ExpirationStatus.EXPIRED)
-        critical = sum(1 for c in creds if c.get_status(thresholds) == ExpirationStatus.CRITICAL)
-        warning = sum(1 for c in creds if c.get_status(thresholds) == ExpirationStatus.WARNING)
-        healthy = sum(1 for c in creds if c.get_status(thresholds) == ExpirationStatus.HEALTHY)
-
+        self._categorize()
         return {
-            "total": len(creds),
-            "expired": expired,
-            "critical": critical,
-            "warning": warning,
-            "healthy": healthy,
+            "total": len(self._by_source.get(source, ())),
+            "expired": self._count(source, ExpirationStatus.EXPIRED),
+            "critical": self._count(source, ExpirationStatus.CRITICAL),
+            "warning": self._count(source, ExpirationStatus.WARNING),
+            "healthy": self._count(source, ExpirationStatus.HEALTHY),
         }
+
+    def _count(self, source: CredentialSource, status: ExpirationStatus) -> int:
+        """Count credentials of a source in a given status."""
+        return len(self._by_source_status.get((source, status), ()))
@@ -1,7 +1,13 @@
 """Domain service for analyzing credential expirations."""
 
+import asyncio
+from collections.abc import AsyncIterable, Iterable
+
 from ..entities import Credential, ExpirationReport
-from ..value_objects import ExpirationThresholds
+from ..value_objects import ExpirationStatus, ExpirationThresholds
+
+# Number of streamed credentials analyzed before yielding to the event loop
+_YIELD_INTERVAL = 5000
 
 
 class ExpirationAnalyzer:
@@ -11,7 +17,7 @@ class ExpirationAnalyzer:
         """Initialize analyzer with thresholds."""
         self._thresholds = thresholds
 
-    def analyze(self, credentials: list[Credential]) -> ExpirationReport:
+    def analyze(self, credentials: Iterable[Credential]) -> ExpirationReport:
         """
         Analyze credentials and generate an expiration report.
 
@@ -21,13 +27,44 @@ class ExpirationAnalyzer:
         Returns:
             ExpirationReport with categorized credentials.
         """
-        # Filter to only credentials within the info threshold
-        relevant = [c for c in credentials if c.requires_notification(self._thresholds)]
+        thresholds = self._thresholds
+
+        # Filter to credentials within the info threshold and categorize them in one pass
+        categorized = [
+            (c, c.get_status(thresholds))
+            for c in credentials
+            if c.requires_notification(thresholds)
+        ]
+
+        return ExpirationReport.from_categorized(categorized, thresholds)
+
+    async def analyze_stream(self, credentials: AsyncIterable[Credential]) -> ExpirationReport:
+        """
+        Analyze credentials as they are streamed and generate an expiration report.
+
+        Only credentials within the info threshold are kept, so memory is bounded
+        by the number of relevant credentials rather than the total. Control is
+        yielded to the event loop periodically so large tenants do not stall
+        concurrent work such as API requests.
+
+        Args:
+            credentials: Async iterable of credentials to analyze.
+
+        Returns:
+            ExpirationReport with categorized credentials.
+        """
+        thresholds = self._thresholds
+        categorized: list[tuple[Credential, ExpirationStatus]] = []
+        append = categorized.append
+        seen = 0
+        async for credential in credentials:
+            if credential.requires_notification(thresholds):
+                append((credential, credential.get_status(thresholds)))
+            seen += 1
+            if seen % _YIELD_INTERVAL == 0:
+                await asyncio.sleep(0)
 
-        return ExpirationReport(
-            credentials=relevant,
-            thresholds=self._thresholds,
-        )
+        return ExpirationReport.from_categorized(categorized, thresholds)
 
     def filter_requiring_attention(self, credentials: list[Credential]) -> list[Credential]:
         """Filter credentials that require immediate attention."""
@@ -15,8 +15,10 @@ class CredentialSource(StrEnum):
     @property
     def display_name(self) -> str:
         """Human-readable display name."""
-        match self:
-            case CredentialSource.APP_REGISTRATION:
-                return "App Registration"
-            case CredentialSource.SERVICE_PRINCIPAL:
-                return "Service Principal"
+        return _DISPLAY_NAMES[self]
+
+
+_DISPLAY_NAMES: dict[CredentialSource, str] = {
+    CredentialSource.APP_REGISTRATION: "App Registration",
+    CredentialSource.SERVICE_PRINCIPAL: "Service Principal",
+}
@@ -14,11 +14,15 @@ class ExpirationStatus(StrEnum):
     @property
     def requires_attention(self) -> bool:
         """Check if this status requires attention."""
-        return self in {
-            ExpirationStatus.EXPIRED,
-            ExpirationStatus.CRITICAL,
-            ExpirationStatus.WARNING,
-        }
+        return _REQUIRES_ATTENTION[self]
 
     def __str__(self) -> str:
         return self.value
+
+
+_REQUIRES_ATTENTION: dict[ExpirationStatus, bool] = {
+    ExpirationStatus.EXPIRED: True,
+    ExpirationStatus.CRITICAL: True,
+    ExpirationStatus.WARNING: True,
+    ExpirationStatus.HEALTHY: False,
+}
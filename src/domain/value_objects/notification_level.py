@@ -13,21 +13,22 @@ class NotificationLevel(StrEnum):
     @property
     def emoji(self) -> str:
         """Get emoji representation for this level."""
-        match self:
-            case NotificationLevel.CRITICAL:
-                return "🔴"
-            case NotificationLevel.WARNING:
-                return "🟡"
-            case NotificationLevel.INFO:
-                return "🟢"
+        return _EMOJI[self]
 
     @property
     def color_hex(self) -> str:
         """Get hex color code for this level."""
-        match self:
-            case NotificationLevel.CRITICAL:
-                return "#dc3545"
-            case NotificationLevel.WARNING:
-                return "#ffc107"
-            case NotificationLevel.INFO:
-                return "#17a2b8"
+        return _COLOR_HEX[self]
+
+
+_EMOJI: dict[NotificationLevel, str] = {
+    NotificationLevel.CRITICAL: "🔴",
+    NotificationLevel.WARNING: "🟡",
+    NotificationLevel.INFO: "🟢",
+}
+
+_COLOR_HEX: dict[NotificationLevel, str] = {
+    NotificationLevel.CRITICAL: "#dc3545",
+    NotificationLevel.WARNING: "#ffc107",
+    NotificationLevel.INFO: "#17a2b8",
+}
@@ -13,9 +13,9 @@ class ExpirationThresholds:
 
     def __post_init__(self) -> None:
         """Validate thresholds are in correct order."""
-        if not (0 < self.critical < self.warning < self.info):
+        critical, warning, info = self.critical, self.warning, self.info
+        if critical <= 0 or critical >= warning or warning >= info:
             msg = (
-                f"Thresholds must be: 0 < critical({self.critical}) "
-                f"< warning({self.warning}) < info({self.info})"
+                f"Thresholds must be: 0 < critical({critical}) < warning({warning}) < info({info})"
             )
             raise ValueError(msg)
@@ -7,7 +7,8 @@ from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
-from fastapi import FastAPI, HTTPException, Request, status
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response, status
 from fastapi.responses import JSONResponse
 
 from .models import (
@@ -20,7 +21,7 @@ from .models import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, Callable, Coroutine
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine
 
     from ....application.use_cases.check_expiring_credentials import CheckResult
     from ....domain.entities import ExpirationReport
@@ -54,6 +55,8 @@ def _report_to_response(report: ExpirationReport) -> ReportResponse:
 class ApiState:
     """Shared state for API endpoints."""
 
+    __slots__ = ("check_func", "last_report_json", "version")
+
     def __init__(
         self,
         check_func: Callable[[], Coroutine[None, None, CheckResult]],
@@ -62,13 +65,14 @@ class ApiState:
         """Initialize API state."""
         self.check_func = check_func
         self.version = version
-        self.last_report: ExpirationReport | None = None
-        self.last_check_at: datetime | None = None
+        self.last_report_json: bytes | None = None
 
 
 def create_app(
     check_func: Callable[[], Coroutine[None, None, CheckResult]],
     version: str = "1.1.0",
+    on_startup: Callable[[], Awaitable[None]] | None = None,
+    on_shutdown: Callable[[], Awaitable[None]] | None = None,
 ) -> FastAPI:
     """
     Create FastAPI application.
@@ -76,6 +80,8 @@ def create_app(
     Args:
         check_func: Async function to execute credential check.
         version: Application version string.
+        on_startup: Optional async callback starting background work on startup.
+        on_shutdown: Optional async callback releasing shared resources on shutdown.
 
     Returns:
         Configured FastAPI application.
@@ -86,8 +92,12 @@ def create_app(
     async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
         """Application lifespan handler."""
         logger.info("API server starting...")
+        if on_startup is not None:
+            await on_startup()
         yield
         logger.info("API server shutting down...")
+        if on_shutdown is not None:
+            await on_shutdown()
 
     app = FastAPI(
         title="Entra ID Secrets Notification API",
@@ -103,68 +113,73 @@ def create_app(
 
     @app.get(
         "/health",
-        response_model=HealthResponse,
+        response_model=None,
         tags=["Health"],
         summary="Health check",
         description="Check if the service is healthy and running.",
+        responses={200: {"model": HealthResponse}},
     )
-    async def health_check() -> HealthResponse:
-        return HealthResponse(
-            status="healthy",
-            version=state.version,
-            timestamp=datetime.now(UTC),
+    async def health_check() -> Response:
+        # Polled frequently by probes, so serialize directly instead of validating a model
+        body = {"status": "healthy", "version": state.version, "timestamp": datetime.now(UTC)}
+        return Response(
+            content=orjson.dumps(body, option=orjson.OPT_UTC_Z),
+            media_type="application/json",
         )
 
     @app.get(
         "/api/v1/report",
-        response_model=ReportResponse,
+        response_model=None,
         tags=["Reports"],
         summary="Get latest report",
         description="Get the latest credential expiration report summary. "
         "Does not include any credential details for security.",
         responses={
+            200: {"model": ReportResponse},
             404: {"model": ErrorResponse, "description": "No report available"},
         },
     )
-    async def get_report() -> ReportResponse:
-        if state.last_report is None:
+    async def get_report() -> Response:
+        if state.last_report_json is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No report available. Trigger a check first using POST /api/v1/check",
             )
-        return _report_to_response(state.last_report)
+        return Response(content=state.last_report_json, media_type="application/json")
 
     @app.post(
         "/api/v1/check",
-        response_model=CheckResponse,
+        response_model=None,
         tags=["Operations"],
         summary="Trigger credential check",
         description="Trigger an on-demand credential expiration check. "
         "This will scan all Entra ID applications and optionally send notifications.",
         responses={
+            200: {"model": CheckResponse},
             500: {"model": ErrorResponse, "description": "Check failed"},
         },
     )
-    async def trigger_check() -> CheckResponse:
+    async def trigger_check() -> Response:
         try:
             logger.info("API: Triggering credential check...")
             result = await state.check_func()
 
-            # Store the report for future queries
-            state.last_report = result.report
-            state.last_check_at = datetime.now(UTC)
+            # Serialize the report once; it is embedded below and served by /api/v1/report
+            report_json = _report_to_response(result.report).model_dump_json().encode()
+            state.last_report_json = report_json
 
             msg = (
                 "Check completed successfully" if result.success else "Check completed with errors"
             )
-            return CheckResponse(
-                success=result.success,
-                message=msg,
-                report=_report_to_response(result.report),
-                notifications_sent=result.notifications_sent,
-                notifications_failed=result.notifications_failed,
-                dry_run=result.dry_run,
-            )
+            body = {
+                "success": result.success,
+                "message": msg,
+                "report": orjson.Fragment(report_json),
+                "notifications_sent": result.notifications_sent,
+                "notifications_failed": result.notifications_failed,
+                "dry_run": result.dry_run,
+            }
+            return Response(content=orjson.dumps(body), media_type="application/json")
 
         except Exception as e:
             logger.exception("API: Credential check failed")
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from contextlib import suppress
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import httpx
 import msal
+import orjson
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +39,15 @@ class GraphClient:
     GRAPH_BASE_URL: ClassVar[str] = "https://graph.microsoft.com/v1.0"
     AUTHORITY_BASE: ClassVar[str] = "https://login.microsoftonline.com"
     SCOPE: ClassVar[list[str]] = ["https://graph.microsoft.com/.default"]
+    # Delay before retrying a failed background token refresh
+    TOKEN_RETRY_SECONDS: ClassVar[float] = 60.0
+    # Maximum page size supported by the applications and servicePrincipals endpoints
+    PAGE_SIZE: ClassVar[int] = 999
+    # Only request the properties the repository reads to keep payloads small
+    APPLICATION_SELECT: ClassVar[str] = "appId,displayName,passwordCredentials,keyCredentials"
+    SERVICE_PRINCIPAL_SELECT: ClassVar[str] = (
+        "id,appId,displayName,passwordCredentials,keyCredentials"
+    )
 
     def __init__(self, config: GraphClientConfig) -> None:
         """Initialize the Graph client."""
@@ -40,6 +55,25 @@ class GraphClient:
         self._access_token: str | None = None
         self._token_expiry: datetime | None = None
         self._msal_app: msal.ConfidentialClientApplication | None = None
+        self._token_lock = asyncio.Lock()
+        self._headers: dict[str, str] = {}
+        self._http: httpx.AsyncClient | None = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client shared across requests."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=self._config.timeout,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and release pooled connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     def _get_msal_app(self) -> msal.ConfidentialClientApplication:
         """Get or create MSAL application instance."""
@@ -55,23 +89,63 @@ class GraphClient:
     async def _acquire_token(self) -> str:
         """Acquire access token using client credentials flow."""
         # Check if existing token is still valid
+        token = self._valid_token()
+        if token is not None:
+            return token
+
+        # Serialize refreshes so concurrent callers share a single MSAL round trip
+        async with self._token_lock:
+            token = self._valid_token()
+            if token is not None:
+                return token
+
+            app = self._get_msal_app()
+            # MSAL is synchronous; keep the event loop free during the HTTPS round trip
+            result = await asyncio.to_thread(app.acquire_token_for_client, scopes=self.SCOPE)
+
+            if "access_token" not in result:
+                error = result.get("error_description", result.get("error", "Unknown error"))
+                msg = f"Failed to acquire access token: {error}"
+                raise RuntimeError(msg)
+
+            access_token: str = result["access_token"]
+            expires_in = result.get("expires_in", 3600)
+            # Refresh 5 minutes before expiry
+            self._token_expiry = datetime.now(UTC) + timedelta(seconds=expires_in - 300)
+            self._headers = {
+                "Authorization": f"Bearer {access_token}",
+                "Content-Type": "application/json",
+            }
+            self._access_token = access_token
+
+            return access_token
+
+    def _valid_token(self) -> str | None:
+        """Get the cached access token unless it is due for refresh."""
         if self._access_token and self._token_expiry and datetime.now(UTC) < self._token_expiry:
             return self._access_token
+        return None
 
-        app = self._get_msal_app()
-        result = app.acquire_token_for_client(scopes=self.SCOPE)
-
-        if "access_token" not in result:
-            error = result.get("error_description", result.get("error", "Unknown error"))
-            msg = f"Failed to acquire access token: {error}"
-            raise RuntimeError(msg)
-
-        self._access_token = result["access_token"]
-        expires_in = result.get("expires_in", 3600)
-        # Refresh 5 minutes before expiry
-        self._token_expiry = datetime.now(UTC) + timedelta(seconds=expires_in - 300)
+    async def keep_token_fresh(self) -> None:
+        """
+        Refresh the access token in the background whenever it becomes due.
 
-        return self._access_token
+        Runs until cancelled so that requests never wait on token acquisition.
+        """
+        while True:
+            try:
+                await self._acquire_token()
+            except Exception:
+                logger.exception("Background token refresh failed")
+                delay = self.TOKEN_RETRY_SECONDS
+            else:
+                expiry = self._token_expiry
+                delay = (
+                    (expiry - datetime.now(UTC)).total_seconds()
+                    if expiry
+                    else self.TOKEN_RETRY_SECONDS
+                )
+            await asyncio.sleep(max(delay, 1.0))
 
     async def get_applications(self) -> list[dict[str, Any]]:
         """
@@ -80,8 +154,7 @@ class GraphClient:
         Returns:
             List of application dictionaries from Graph API.
         """
-        logger.info("Fetching application registrations from Entra ID...")
-        applications = await self._get_all_pages("/applications")
+        applications = [app async for page in self.iter_applications() for app in page]
         logger.info("Found %d application registrations", len(applications))
         return applications
 
@@ -92,40 +165,87 @@ class GraphClient:
         Returns:
             List of service principal dictionaries from Graph API.
         """
-        logger.info("Fetching service principals from Entra ID...")
-        service_principals = await self._get_all_pages("/servicePrincipals")
+        service_principals = [sp async for page in self.iter_service_principals() for sp in page]
         logger.info("Found %d service principals", len(service_principals))
         return service_principals
 
-    async def _get_all_pages(self, endpoint: str) -> list[dict[str, Any]]:
+    async def iter_applications(self) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Stream application registrations page by page.
+
+        Yields:
+            Pages of application dictionaries from Graph API.
+        """
+        logger.info("Fetching application registrations from Entra ID...")
+        async for page in self._iter_pages(
+            f"/applications?$select={self.APPLICATION_SELECT}&$top={self.PAGE_SIZE}"
+        ):
+            yield page
+
+    async def iter_service_principals(self) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Stream service principals page by page.
+
+        Yields:
+            Pages of service principal dictionaries from Graph API.
         """
-        Retrieve all pages from a paginated Graph API endpoint.
+        logger.info("Fetching service principals from Entra ID...")
+        async for page in self._iter_pages(
+            f"/servicePrincipals?$select={self.SERVICE_PRINCIPAL_SELECT}&$top={self.PAGE_SIZE}"
+        ):
+            yield page
+
+    async def _iter_pages(self, endpoint: str) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Iterate over the pages of a paginated Graph API endpoint.
+
+        The next page is requested as soon as a page arrives, so its download overlaps
+        with the caller processing the current one. At most two pages are held in memory.
 
         Args:
             endpoint: The API endpoint path.
 
-        Returns:
-            Combined list of all results across pages.
+        Yields:
+            The results of each page.
         """
-        results: list[dict[str, Any]] = []
-        url: str | None = endpoint
-
-        async with httpx.AsyncClient(timeout=self._config.timeout) as client:
-            while url:
-                token = await self._acquire_token()
-                headers = {
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json",
-                }
+        client = self._get_http_client()
+        await self._acquire_token()
+        pending: asyncio.Task[dict[str, Any]] | None = asyncio.create_task(
+            self._fetch_page(client, endpoint)
+        )
+        try:
+            while pending is not None:
+                data = await pending
+                next_url = data.get("@odata.nextLink")
+                pending = (
+                    asyncio.create_task(self._fetch_page(client, next_url)) if next_url else None
+                )
+                yield data.get("value", [])
+        finally:
+            if pending is not None:
+                pending.cancel()
+                with suppress(asyncio.CancelledError, Exception):
+                    await pending
+
+    async def _fetch_page(self, client: httpx.AsyncClient, url: str) -> dict[str, Any]:
+        """
+        Fetch and decode a single page of a Graph API collection.
 
-                # Handle both relative and absolute URLs
-                full_url = url if url.startswith("http") else f"{self.GRAPH_BASE_URL}{url}"
+        Args:
+            client: The pooled HTTP client.
+            url: Relative endpoint path or absolute @odata.nextLink URL.
 
-                response = await client.get(full_url, headers=headers)
-                response.raise_for_status()
-                data = response.json()
+        Returns:
+            The decoded page.
+        """
+        # Only long scans outlive the token; refresh once it is due
+        if self._token_expiry is None or datetime.now(UTC) >= self._token_expiry:
+            await self._acquire_token()
 
-                results.extend(data.get("value", []))
-                url = data.get("@odata.nextLink")
+        # Handle both relative and absolute URLs
+        full_url = url if url.startswith("http") else self.GRAPH_BASE_URL + url
 
-        return results
+        response = await client.get(full_url, headers=self._headers)
+        response.raise_for_status()
+        page: dict[str, Any] = orjson.loads(response.content)
+        return page
@@ -2,17 +2,114 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import UTC, datetime
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from ....application.exceptions import CredentialRepositoryError
 from ....domain.entities import Credential
 from ....domain.value_objects import CredentialSource, CredentialType
 from .graph_client import GraphClient, GraphClientConfig
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
 logger = logging.getLogger(__name__)
 
+# Graph API credential collections and the credential type each one holds
+_CRED_KINDS: tuple[tuple[str, CredentialType], ...] = (
+    ("passwordCredentials", CredentialType.PASSWORD),
+    ("keyCredentials", CredentialType.CERTIFICATE),
+)
+
+
+def _parse_datetime(dt_string: str) -> datetime | None:
+    """Parse ISO datetime string to datetime object, logging values that do not parse."""
+    dt = _parse_iso_datetime(dt_string)
+    if dt is None:
+        logger.warning("Failed to parse datetime: %s", dt_string)
+    return dt
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(dt_string: str) -> datetime | None:
+    """Parse ISO datetime string, caching repeated expiry values."""
+    # Fast path for the fixed-width "YYYY-MM-DDTHH:MM:SS[.f…]Z" format emitted by Graph API
+    length = len(dt_string)
+    fraction = dt_string[20:-1]
+    digits = (
+        dt_string[0:4]
+        + dt_string[5:7]
+        + dt_string[8:10]
+        + dt_string[11:13]
+        + dt_string[14:16]
+        + dt_string[17:19]
+        + fraction
+    )
+    if (
+        length >= 20
+        and dt_string[-1] == "Z"
+        and dt_string[4] == "-"
+        and dt_string[7] == "-"
+        and dt_string[10] == "T"
+        and dt_string[13] == ":"
+        and dt_string[16] == ":"
+        and (length == 20 or (dt_string[19] == "." and fraction))
+        # int() would also accept signs, spaces, underscores and non-ASCII digits
+        and digits.isascii()
+        and digits.isdigit()
+    ):
+        try:
+            return datetime(
+                int(dt_string[0:4]),
+                int(dt_string[5:7]),
+                int(dt_string[8:10]),
+                int(dt_string[11:13]),
+                int(dt_string[14:16]),
+                int(dt_string[17:19]),
+                int(fraction[:6].ljust(6, "0")) if fraction else 0,
+                tzinfo=UTC,
+            )
+        except ValueError:
+            pass
+
+    try:
+        # fromisoformat accepts the trailing "Z" emitted by Graph API natively
+        dt = datetime.fromisoformat(dt_string)
+        # Ensure timezone-aware
+        return dt if dt.tzinfo else dt.replace(tzinfo=UTC)
+    except ValueError:
+        return None
+
+
+async def _next_page(
+    pages: asyncio.Queue[list[Credential] | None], producer: asyncio.Task[None]
+) -> list[Credential] | None:
+    """
+    Get the next queued page, re-raising the producer's error if it fails first.
+
+    Returns:
+        The next page, or None once the producer has finished.
+    """
+    if not pages.empty():
+        return pages.get_nowait()
+    if producer.done():
+        producer.result()
+        return None
+
+    getter = asyncio.ensure_future(pages.get())
+    try:
+        await asyncio.wait((getter, producer), return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        if not getter.done():
+            getter.cancel()
+    if getter.done() and not getter.cancelled():
+        return getter.result()
+    producer.result()
+    return None
+
 
 class EntraIdCredentialRepository:
     """
@@ -37,6 +134,14 @@ class EntraIdCredentialRepository:
         self._client = GraphClient(config)
         self._monitor_service_principals = monitor_service_principals
 
+    async def aclose(self) -> None:
+        """Close the Graph API client and its pooled connections."""
+        await self._client.aclose()
+
+    async def keep_token_fresh(self) -> None:
+        """Keep the Graph API access token refreshed in the background until cancelled."""
+        await self._client.keep_token_fresh()
+
     async def get_all_credentials(self) -> list[Credential]:
         """
         Retrieve all credentials from Entra ID applications and service principals.
@@ -47,106 +152,124 @@ class EntraIdCredentialRepository:
         Raises:
             CredentialRepositoryError: If retrieval fails.
         """
-        try:
-            credentials: list[Credential] = []
+        return [credential async for credential in self.get_credentials_stream()]
 
-            # Fetch app registration credentials
-            app_credentials = await self._fetch_application_credentials()
-            credentials.extend(app_credentials)
+    async def get_credentials_stream(self) -> AsyncIterator[Credential]:
+        """
+        Stream credentials from Entra ID applications and service principals.
 
-            # Fetch service principal credentials if enabled
-            if self._monitor_service_principals:
-                sp_credentials = await self._fetch_service_principal_credentials()
-                credentials.extend(sp_credentials)
+        Yields:
+            Credentials across all applications and service principals.
 
-            return credentials
+        Raises:
+            CredentialRepositoryError: If retrieval fails.
+        """
+        # Fetch service principals concurrently so both Graph request streams overlap. The
+        # queue holds one mapped page, so memory stays bounded while app pages are consumed.
+        sp_pages: asyncio.Queue[list[Credential] | None] = asyncio.Queue(maxsize=1)
+        sp_task = (
+            asyncio.create_task(self._queue_service_principal_pages(sp_pages))
+            if self._monitor_service_principals
+            else None
+        )
+        try:
+            async for credential in self._iter_application_credentials():
+                if sp_task is not None and sp_task.done():
+                    # Surface a service principal failure without draining all app pages
+                    sp_task.result()
+                yield credential
+
+            if sp_task is not None:
+                while (page := await _next_page(sp_pages, sp_task)) is not None:
+                    for credential in page:
+                        yield credential
 
         except Exception as e:
             msg = f"Failed to retrieve credentials from Entra ID: {e}"
             logger.exception(msg)
             raise CredentialRepositoryError(msg) from e
+        finally:
+            if sp_task is not None:
+                sp_task.cancel()
+                await asyncio.gather(sp_task, return_exceptions=True)
+
+    async def _iter_application_credentials(self) -> AsyncIterator[Credential]:
+        """Stream credentials from app registrations, one Graph page at a time."""
+        app_count = credential_count = 0
+        async for page in self._client.iter_applications():
+            credentials = self._map_applications(page)
+            app_count += len(page)
+            credential_count += len(credentials)
+            for credential in credentials:
+                yield credential
 
-    async def _fetch_application_credentials(self) -> list[Credential]:
-        """Fetch credentials from app registrations."""
-        applications = await self._client.get_applications()
+        logger.info(
+            "Retrieved %d credentials from %d app registrations",
+            credential_count,
+            app_count,
+        )
+
+    async def _queue_service_principal_pages(
+        self, pages: asyncio.Queue[list[Credential] | None]
+    ) -> None:
+        """Map service principal pages into the queue, ending with ``None``."""
+        sp_count = credential_count = 0
+        async for page in self._client.iter_service_principals():
+            credentials = self._map_service_principals(page)
+            sp_count += len(page)
+            credential_count += len(credentials)
+            await pages.put(credentials)
+
+        logger.info(
+            "Retrieved %d credentials from %d service principals",
+            credential_count,
+            sp_count,
+        )
+        await pages.put(None)
+
+    def _map_applications(self, applications: list[dict[str, Any]]) -> list[Credential]:
+        """Map a page of app registrations to credentials."""
         credentials: list[Credential] = []
+        extend = credentials.extend
+        map_credential = self._map_credential
+        source = CredentialSource.APP_REGISTRATION
 
         for app in applications:
             app_id = app.get("appId", "")
             app_name = app.get("displayName", "Unknown")
 
-            # Process password credentials (secrets)
-            for cred in app.get("passwordCredentials", []):
-                credential = self._map_credential(
-                    cred,
-                    CredentialType.PASSWORD,
-                    app_id,
-                    app_name,
-                    CredentialSource.APP_REGISTRATION,
+            # Process password credentials (secrets) and key credentials (certificates)
+            for key, credential_type in _CRED_KINDS:
+                mapped = (
+                    map_credential(cred, credential_type, app_id, app_name, source)
+                    for cred in app.get(key, ())
                 )
-                if credential:
-                    credentials.append(credential)
-
-            # Process key credentials (certificates)
-            for cred in app.get("keyCredentials", []):
-                credential = self._map_credential(
-                    cred,
-                    CredentialType.CERTIFICATE,
-                    app_id,
-                    app_name,
-                    CredentialSource.APP_REGISTRATION,
-                )
-                if credential:
-                    credentials.append(credential)
+                extend(credential for credential in mapped if credential is not None)
 
-        logger.info(
-            "Retrieved %d credentials from %d app registrations",
-            len(credentials),
-            len(applications),
-        )
         return credentials
 
-    async def _fetch_service_principal_credentials(self) -> list[Credential]:
-        """Fetch credentials from service principals."""
-        service_principals = await self._client.get_service_principals()
+    def _map_service_principals(self, service_principals: list[dict[str, Any]]) -> list[Credential]:
+        """Map a page of service principals to credentials."""
         credentials: list[Credential] = []
+        extend = credentials.extend
+        map_credential = self._map_credential
+        source = CredentialSource.SERVICE_PRINCIPAL
 
         for sp in service_principals:
             sp_object_id = sp.get("id", "")
             app_id = sp.get("appId", "")
             sp_name = sp.get("displayName", "Unknown")
 
-            # Process password credentials (secrets)
-            for cred in sp.get("passwordCredentials", []):
-                credential = self._map_credential(
-                    cred,
-                    CredentialType.PASSWORD,
-                    app_id,
-                    sp_name,
-                    CredentialSource.SERVICE_PRINCIPAL,
-                    object_id=sp_object_id,
-                )
-                if credential:
-                    credentials.append(credential)
-
-            # Process key credentials (certificates)
-            for cred in sp.get("keyCredentials", []):
-                credential = self._map_credential(
-                    cred,
-                    CredentialType.CERTIFICATE,
-                    app_id,
-                    sp_name,
-                    CredentialSource.SERVICE_PRINCIPAL,
-                    object_id=sp_object_id,
+            # Process password credentials (secrets) and key credentials (certificates)
+            for key, credential_type in _CRED_KINDS:
+                mapped = (
+                    map_credential(
+                        cred, credential_type, app_id, sp_name, source, object_id=sp_object_id
+                    )
+                    for cred in sp.get(key, ())
                 )
-                if credential:
-                    credentials.append(credential)
+                extend(credential for credential in mapped if credential is not None)
 
-        logger.info(
-            "Retrieved %d credentials from %d service principals",
-            len(credentials),
-            len(service_principals),
-        )
         return credentials
 
     def _map_credential(
@@ -183,7 +306,7 @@ class EntraIdCredentialRepository:
             )
             return None
 
-        expiry_date = self._parse_datetime(expiry_str)
+        expiry_date = _parse_datetime(expiry_str)
         if not expiry_date:
             return None
 
@@ -197,16 +320,3 @@ class EntraIdCredentialRepository:
             source=source,
             object_id=object_id,
         )
-
-    @staticmethod
-    def _parse_datetime(dt_string: str) -> datetime | None:
-        """Parse ISO datetime string to datetime object."""
-        try:
-            # Handle various formats from Graph API
-            dt_string = dt_string.replace("Z", "+00:00")
-            dt = datetime.fromisoformat(dt_string)
-            # Ensure timezone-aware
-            return dt if dt.tzinfo else dt.replace(tzinfo=UTC)
-        except ValueError:
-            logger.warning("Failed to parse datetime: %s", dt_string)
-            return None
@@ -4,18 +4,29 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from itertools import islice
 from typing import TYPE_CHECKING
 
+import httpx
+
 if TYPE_CHECKING:
     from ....domain.entities import Credential, ExpirationReport
 
+# str.translate table escaping untrusted text spliced into HTML notification bodies
+HTML_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
+
 
 class BaseNotificationSender(ABC):
     """Abstract base class for notification senders."""
 
+    __slots__ = ("_http", "_logger")
+
     def __init__(self) -> None:
         """Initialize the notification sender."""
         self._logger = logging.getLogger(self.__class__.__name__)
+        self._http: httpx.AsyncClient | None = None
 
     @abstractmethod
     async def send(self, report: ExpirationReport) -> bool:
@@ -27,6 +38,22 @@ class BaseNotificationSender(ABC):
         """Check if the sender is properly configured."""
         ...
 
+    async def aclose(self) -> None:
+        """Release connections held by the sender."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=30.0,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            )
+        return self._http
+
     def format_credential_list(
         self,
         credentials: list[Credential],
@@ -36,8 +63,9 @@ class BaseNotificationSender(ABC):
     ) -> str:
         """Format a list of credentials for display."""
         lines: list[str] = []
+        append = lines.append
 
-        for credential in credentials[:max_items]:
+        for credential in islice(credentials, max_items):
             status = "EXPIRED" if credential.is_expired else f"{credential.days_until_expiry}d"
             name = credential.display_name or str(credential.id)[:8]
             app_name = credential.application_name
@@ -45,7 +73,7 @@ class BaseNotificationSender(ABC):
             line = f"• {app_name} - {cred_type} '{name}': {status}"
             if include_url:
                 line += f"\n  Manage: {credential.azure_portal_url}"
-            lines.append(line)
+            append(line)
 
         if len(credentials) > max_items:
             lines.append(f"... and {len(credentials) - max_items} more")
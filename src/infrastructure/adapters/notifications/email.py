@@ -2,18 +2,51 @@
 
 from __future__ import annotations
 
+import asyncio
 import smtplib
+from base64 import encodebytes
+from contextlib import suppress
 from dataclasses import dataclass
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email.header import Header
 from typing import TYPE_CHECKING
 
-from ....domain.value_objects import CredentialSource, NotificationLevel
+from ....domain.value_objects import CredentialSource
 from .base import BaseNotificationSender
+from .email_format import credentials_by_source, format_html_body, format_subject
 
 if TYPE_CHECKING:
     from ....domain.entities import Credential, ExpirationReport
 
+# The fixed two-part message is formatted directly instead of walking an email.mime tree.
+# Bodies are base64 encoded, so they can never contain the boundary ("-" is not in the
+# base64 alphabet) and stay 7-bit clean regardless of application names.
+_BOUNDARY = "==entra-id-secrets-alternative=="
+
+_MESSAGE_TEMPLATE = (
+    "Subject: {subject}\r\n"
+    "From: {from_address}\r\n"
+    "To: {to_addresses}\r\n"
+    "MIME-Version: 1.0\r\n"
+    'Content-Type: multipart/alternative; boundary="{boundary}"\r\n'
+    "\r\n"
+    "--{boundary}\r\n"
+    'Content-Type: text/plain; charset="utf-8"\r\n'
+    "Content-Transfer-Encoding: base64\r\n"
+    "\r\n"
+    "{text_body}"
+    "--{boundary}\r\n"
+    'Content-Type: text/html; charset="utf-8"\r\n'
+    "Content-Transfer-Encoding: base64\r\n"
+    "\r\n"
+    "{html_body}"
+    "--{boundary}--\r\n"
+)
+
+
+def _encode_body(body: str) -> str:
+    """Base64 encode a message body into CRLF-terminated 76-character lines."""
+    return encodebytes(body.encode()).decode("ascii").replace("\n", "\r\n")
+
 
 @dataclass(frozen=True, slots=True)
 class EmailConfig:
@@ -32,19 +65,22 @@ class EmailConfig:
 class EmailNotificationSender(BaseNotificationSender):
     """Send notifications via SMTP email."""
 
+    __slots__ = ("_config", "_recipients", "_smtp", "_smtp_lock")
+
     def __init__(self, config: EmailConfig) -> None:
         """Initialize the email sender."""
         super().__init__()
         self._config = config
+        self._recipients = tuple(
+            address for r in config.to_addresses.split(",") if (address := r.strip())
+        )
+        self._smtp: smtplib.SMTP | None = None
+        self._smtp_lock = asyncio.Lock()
 
     def is_configured(self) -> bool:
         """Check if email is properly configured."""
-        return (
-            self._config.enabled
-            and bool(self._config.server)
-            and bool(self._config.from_address)
-            and bool(self._config.to_addresses)
-        )
+        config = self._config
+        return config.enabled and all((config.server, config.from_address, self._recipients))
 
     async def send(self, report: ExpirationReport) -> bool:
         """Send email notification."""
@@ -53,15 +89,11 @@ class EmailNotificationSender(BaseNotificationSender):
             return False
 
         try:
-            msg = self._build_message(report)
-            recipients = [r.strip() for r in self._config.to_addresses.split(",")]
+            message = self._build_message(report)
 
-            with smtplib.SMTP(self._config.server, self._config.port) as server:
-                if self._config.use_tls:
-                    server.starttls()
-                if self._config.username and self._config.password:
-                    server.login(self._config.username, self._config.password)
-                server.sendmail(self._config.from_address, recipients, msg.as_string())
+            # smtplib is blocking, so deliver off the event loop over one connection at a time
+            async with self._smtp_lock:
+                await asyncio.to_thread(self._deliver, message)
 
             self._logger.info("Email sent to %s", self._config.to_addresses)
             return True
@@ -70,33 +102,85 @@ class EmailNotificationSender(BaseNotificationSender):
             self._logger.exception("Failed to send email")
             return False
 
-    def _build_message(self, report: ExpirationReport) -> MIMEMultipart:
-        """Build the email message."""
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = self._format_subject(report)
-        msg["From"] = self._config.from_address
-        msg["To"] = self._config.to_addresses
-
-        text_body = self._format_text_body(report)
-        html_body = self._format_html_body(report)
-
-        msg.attach(MIMEText(text_body, "plain"))
-        msg.attach(MIMEText(html_body, "html"))
-
-        return msg
-
-    def _format_subject(self, report: ExpirationReport) -> str:
-        """Format email subject line."""
-        prefix = {
-            NotificationLevel.CRITICAL: "[CRITICAL]",
-            NotificationLevel.WARNING: "[WARNING]",
-            NotificationLevel.INFO: "[INFO]",
-        }.get(report.notification_level, "")
-
-        return f"{prefix} Entra ID Secrets Alert - {report.get_summary()}"
-
-    def _format_text_body(self, report: ExpirationReport) -> str:
-        """Format plain text email body."""
+    async def aclose(self) -> None:
+        """Close the persistent SMTP connection, if any."""
+        async with self._smtp_lock:
+            await asyncio.to_thread(self._close_connection)
+        await super().aclose()
+
+    def _deliver(self, message: bytes) -> None:
+        """
+        Send a message over the persistent connection.
+
+        Stale connections are replaced by the NOOP check in _get_connection. A disconnect
+        during sendmail is not retried, since the server may already have accepted the
+        message; the connection is dropped so the next send reconnects.
+        """
+        smtp = self._get_connection()
+        try:
+            smtp.sendmail(self._config.from_address, self._recipients, message)
+        except smtplib.SMTPServerDisconnected:
+            self._close_connection()
+            raise
+
+    def _get_connection(self) -> smtplib.SMTP:
+        """Get the persistent SMTP connection, connecting and logging in if needed."""
+        if self._smtp is not None:
+            try:
+                code, _ = self._smtp.noop()
+            except (smtplib.SMTPException, OSError):
+                code = -1
+            if code == 250:
+                return self._smtp
+            self._close_connection()
+
+        smtp = smtplib.SMTP(self._config.server, self._config.port)
+        try:
+            if self._config.use_tls:
+                smtp.starttls()
+            if self._config.username and self._config.password:
+                smtp.login(self._config.username, self._config.password)
+        except BaseException:
+            smtp.close()
+            raise
+
+        self._smtp = smtp
+        return smtp
+
+    def _close_connection(self) -> None:
+        """Quit and forget the persistent SMTP connection."""
+        smtp, self._smtp = self._smtp, None
+        if smtp is not None:
+            with suppress(smtplib.SMTPException, OSError):
+                smtp.quit()
+
+    def _build_message(self, report: ExpirationReport) -> bytes:
+        """Build the multipart/alternative email message."""
+        subject = format_subject(report)
+        if not subject.isascii():
+            subject = Header(subject, "utf-8").encode()
+
+        # Sort each source once and share the lists between the text and HTML bodies
+        app_creds, sp_creds = credentials_by_source(report)
+        text_body = _encode_body(self._format_text_body(report, app_creds, sp_creds))
+        html_body = _encode_body(format_html_body(report, app_creds, sp_creds))
+
+        return _MESSAGE_TEMPLATE.format(
+            subject=subject,
+            from_address=self._config.from_address,
+            to_addresses=self._config.to_addresses,
+            boundary=_BOUNDARY,
+            text_body=text_body,
+            html_body=html_body,
+        ).encode("ascii")
+
+    def _format_text_body(
+        self,
+        report: ExpirationReport,
+        app_creds: list[Credential],
+        sp_creds: list[Credential],
+    ) -> str:
+        """Format plain text email body from credentials sorted by expiry."""
         lines = [
             "Entra ID Secrets Expiration Report",
             "=" * 40,
@@ -111,7 +195,6 @@ class EmailNotificationSender(BaseNotificationSender):
         ]
 
         # App Registration section
-        app_creds = report.get_credentials_by_source(CredentialSource.APP_REGISTRATION)
         if app_creds:
             lines.extend(
                 [
@@ -119,16 +202,12 @@ class EmailNotificationSender(BaseNotificationSender):
                     "-" * 40,
                     report.get_source_summary(CredentialSource.APP_REGISTRATION),
                     "",
-                    self.format_credential_list(
-                        sorted(app_creds, key=lambda c: c.days_until_expiry),
-                        max_items=25,
-                    ),
+                    self.format_credential_list(app_creds, max_items=25),
                     "",
                 ]
             )
 
         # Service Principal section
-        sp_creds = report.get_credentials_by_source(CredentialSource.SERVICE_PRINCIPAL)
         if sp_creds:
             lines.extend(
                 [
@@ -136,10 +215,7 @@ class EmailNotificationSender(BaseNotificationSender):
                     "-" * 40,
                     report.get_source_summary(CredentialSource.SERVICE_PRINCIPAL),
                     "",
-                    self.format_credential_list(
-                        sorted(sp_creds, key=lambda c: c.days_until_expiry),
-                        max_items=25,
-                    ),
+                    self.format_credential_list(sp_creds, max_items=25),
                     "",
                 ]
             )
@@ -151,84 +227,3 @@ class EmailNotificationSender(BaseNotificationSender):
             ]
         )
         return "\n".join(lines)
-
-    def _format_html_body(self, report: ExpirationReport) -> str:
-        """Format HTML email body."""
-        color = report.notification_level.color_hex
-
-        sections_html = ""
-
-        # App Registration section
-        app_creds = report.get_credentials_by_source(CredentialSource.APP_REGISTRATION)
-        if app_creds:
-            sections_html += self._build_source_section_html(
-                report, app_creds, "App Registrations", "#0078D4"
-            )
-
-        # Service Principal section
-        sp_creds = report.get_credentials_by_source(CredentialSource.SERVICE_PRINCIPAL)
-        if sp_creds:
-            sections_html += self._build_source_section_html(
-                report, sp_creds, "Service Principals", "#5C2D91"
-            )
-
-        return f"""<!DOCTYPE html>
-<html>
-<head>
-<style>
-body {{ font-family: Arial, sans-serif; margin: 20px; }}
-.header {{ background-color: {color}; color: white; padding: 15px; border-radius: 5px; }}
-.summary {{ background-color: #f8f9fa; padding: 15px; margin: 15px 0; border-radius: 5px; }}
-.section-header {{ background-color: #e9ecef; padding: 10px 15px; margin-top: 20px; border-radius: 5px; }}
-table {{ border-collapse: collapse; width: 100%; margin: 15px 0; }}
-th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-th {{ background-color: #4CAF50; color: white; }}
-tr:nth-child(even) {{ background-color: #f2f2f2; }}
-a {{ color: #0066cc; text-decoration: none; }}
-a:hover {{ text-decoration: underline; }}
-.footer {{ margin-top: 20px; font-size: 12px; color: #6c757d; }}
-</style>
-</head>
-<body>
-<div class="header"><h1>Entra ID Secrets Alert</h1></div>
-<div class="summary">
-<h2>{report.get_summary()}</h2>
-<p>Applications Affected: {report.affected_applications_count}</p>
-<p>Expired: {report.expired_count} | Critical: {report.critical_count} | Warning: {report.warning_count}</p>
-</div>
-{sections_html}
-<div class="footer"><p>Entra ID Secrets Notification System</p></div>
-</body>
-</html>"""
-
-    def _build_source_section_html(
-        self,
-        report: ExpirationReport,
-        credentials: list[Credential],
-        title: str,
-        header_color: str,
-    ) -> str:
-        """Build HTML section for a credential source."""
-        rows = ""
-        sorted_creds = sorted(credentials, key=lambda c: c.days_until_expiry)
-        for cred in sorted_creds[:15]:
-            status = cred.get_status(report.thresholds).value.upper()
-            name = cred.display_name or str(cred.id)[:8]
-            expiry = cred.expiry_date.strftime("%Y-%m-%d")
-            portal_url = cred.azure_portal_url
-            rows += f"<tr><td>{cred.application_name}</td><td>{cred.credential_type}</td>"
-            rows += f"<td>{name}</td><td>{expiry}</td><td>{status}</td>"
-            rows += f'<td><a href="{portal_url}" target="_blank">Manage</a></td></tr>\n'
-
-        if len(sorted_creds) > 15:
-            rows += f'<tr><td colspan="6">... and {len(sorted_creds) - 15} more</td></tr>\n'
-
-        return f"""
-<div class="section-header">
-<h3 style="margin: 0; color: {header_color};">{title}</h3>
-</div>
-<table>
-<tr><th>Application</th><th>Type</th><th>Name</th><th>Expiry</th><th>Status</th><th>Action</th></tr>
-{rows}
-</table>
-"""
@@ -0,0 +1,140 @@
+"""HTML email formatting shared by the SMTP and Graph email senders."""
+
+from __future__ import annotations
+
+from itertools import islice
+from operator import attrgetter
+from typing import TYPE_CHECKING
+
+from ....domain.value_objects import CredentialSource, ExpirationStatus, NotificationLevel
+from .base import HTML_ESCAPE_TABLE
+
+if TYPE_CHECKING:
+    from ....domain.entities import Credential, ExpirationReport
+
+_SUBJECT_PREFIX: dict[NotificationLevel, str] = {
+    NotificationLevel.CRITICAL: "[CRITICAL]",
+    NotificationLevel.WARNING: "[WARNING]",
+    NotificationLevel.INFO: "[INFO]",
+}
+
+_STATUS_LABELS: dict[ExpirationStatus, str] = {
+    status: status.upper() for status in ExpirationStatus
+}
+
+_DAYS_UNTIL_EXPIRY = attrgetter("days_until_expiry")
+
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<style>
+body {{ font-family: Arial, sans-serif; margin: 20px; }}
+.header {{ background-color: {color}; color: white; padding: 15px; border-radius: 5px; }}
+.summary {{ background-color: #f8f9fa; padding: 15px; margin: 15px 0; border-radius: 5px; }}
+.section-header {{ background-color: #e9ecef; padding: 10px 15px; margin-top: 20px; border-radius: 5px; }}
+table {{ border-collapse: collapse; width: 100%; margin: 15px 0; }}
+th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+th {{ background-color: #4CAF50; color: white; }}
+tr:nth-child(even) {{ background-color: #f2f2f2; }}
+a {{ color: #0066cc; text-decoration: none; }}
+a:hover {{ text-decoration: underline; }}
+.footer {{ margin-top: 20px; font-size: 12px; color: #6c757d; }}
+</style>
+</head>
+<body>
+<div class="header"><h1>Entra ID Secrets Alert</h1></div>
+<div class="summary">
+<h2>{summary}</h2>
+<p>Applications Affected: {affected}</p>
+<p>Expired: {expired} | Critical: {critical} | Warning: {warning}</p>
+</div>
+{sections}
+<div class="footer"><p>Entra ID Secrets Notification System</p></div>
+</body>
+</html>"""
+
+_SECTION_TEMPLATE = """
+<div class="section-header">
+<h3 style="margin: 0; color: {header_color};">{title}</h3>
+</div>
+<table>
+<tr><th>Application</th><th>Type</th><th>Name</th><th>Expiry</th><th>Status</th><th>Action</th></tr>
+{rows}
+</table>
+"""
+
+
+def format_subject(report: ExpirationReport) -> str:
+    """Format email subject line."""
+    prefix = _SUBJECT_PREFIX.get(report.notification_level, "")
+    return f"{prefix} Entra ID Secrets Alert - {report.get_summary()}"
+
+
+def credentials_by_source(report: ExpirationReport) -> tuple[list[Credential], list[Credential]]:
+    """Get app registration and service principal credentials sorted by expiry."""
+    return (
+        sorted(
+            report.get_credentials_by_source(CredentialSource.APP_REGISTRATION),
+            key=_DAYS_UNTIL_EXPIRY,
+        ),
+        sorted(
+            report.get_credentials_by_source(CredentialSource.SERVICE_PRINCIPAL),
+            key=_DAYS_UNTIL_EXPIRY,
+        ),
+    )
+
+
+def format_html_body(
+    report: ExpirationReport,
+    app_creds: list[Credential],
+    sp_creds: list[Credential],
+) -> str:
+    """Format HTML email body from credentials sorted by expiry."""
+    sections: list[str] = []
+
+    # App Registration section
+    if app_creds:
+        sections.append(_build_source_section(report, app_creds, "App Registrations", "#0078D4"))
+
+    # Service Principal section
+    if sp_creds:
+        sections.append(_build_source_section(report, sp_creds, "Service Principals", "#5C2D91"))
+
+    return _HTML_TEMPLATE.format(
+        color=report.notification_level.color_hex,
+        summary=report.get_summary(),
+        affected=report.affected_applications_count,
+        expired=report.expired_count,
+        critical=report.critical_count,
+        warning=report.warning_count,
+        sections="".join(sections),
+    )
+
+
+def _build_source_section(
+    report: ExpirationReport,
+    credentials: list[Credential],
+    title: str,
+    header_color: str,
+) -> str:
+    """Build HTML section for a credential source from credentials sorted by expiry."""
+    parts: list[str] = []
+    append = parts.append
+    status_of = report.get_status
+    for cred in islice(credentials, 15):
+        status = _STATUS_LABELS[status_of(cred)]
+        name = (cred.display_name or str(cred.id)[:8]).translate(HTML_ESCAPE_TABLE)
+        expiry = cred.expiry_date.date().isoformat()
+        portal_url = cred.azure_portal_url
+        append(
+            f"<tr><td>{cred.application_name.translate(HTML_ESCAPE_TABLE)}</td>"
+            f"<td>{cred.credential_type}</td>"
+            f"<td>{name}</td><td>{expiry}</td><td>{status}</td>"
+            f'<td><a href="{portal_url}" target="_blank">Manage</a></td></tr>\n'
+        )
+
+    if len(credentials) > 15:
+        append(f'<tr><td colspan="6">... and {len(credentials) - 15} more</td></tr>\n')
+    rows = "".join(parts)
+
+    return _SECTION_TEMPLATE.format(header_color=header_color, title=title, rows=rows)
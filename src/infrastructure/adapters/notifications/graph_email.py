@@ -2,18 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any, ClassVar
 
-import httpx
 import msal
+import orjson
 
-from ....domain.value_objects import CredentialSource, NotificationLevel
 from .base import BaseNotificationSender
+from .email_format import credentials_by_source, format_html_body, format_subject
 
 if TYPE_CHECKING:
-    from ....domain.entities import Credential, ExpirationReport
+    from ....domain.entities import ExpirationReport
 
 
 @dataclass(frozen=True, slots=True)
@@ -32,6 +33,15 @@ class GraphEmailConfig:
 class GraphEmailNotificationSender(BaseNotificationSender):
     """Send notifications via Microsoft Graph API email."""
 
+    __slots__ = (
+        "_access_token",
+        "_config",
+        "_msal_app",
+        "_recipients",
+        "_token_expiry",
+        "_token_lock",
+    )
+
     GRAPH_BASE_URL: ClassVar[str] = "https://graph.microsoft.com/v1.0"
     AUTHORITY_BASE: ClassVar[str] = "https://login.microsoftonline.com"
     SCOPE: ClassVar[list[str]] = ["https://graph.microsoft.com/.default"]
@@ -40,19 +50,28 @@ class GraphEmailNotificationSender(BaseNotificationSender):
         """Initialize the Graph email sender."""
         super().__init__()
         self._config = config
+        # Prebuilt Graph recipient objects, reused by every message payload
+        self._recipients = tuple(
+            {"emailAddress": {"address": address}}
+            for r in config.to_addresses.split(",")
+            if (address := r.strip())
+        )
         self._access_token: str | None = None
-        self._token_expiry: datetime | None = None
+        self._token_expiry = 0.0  # time.monotonic() deadline for the cached token
+        self._token_lock = asyncio.Lock()
         self._msal_app: msal.ConfidentialClientApplication | None = None
 
     def is_configured(self) -> bool:
         """Check if Graph email is properly configured."""
-        return (
-            self._config.enabled
-            and bool(self._config.tenant_id)
-            and bool(self._config.client_id)
-            and bool(self._config.client_secret)
-            and bool(self._config.from_address)
-            and bool(self._config.to_addresses)
+        config = self._config
+        return config.enabled and all(
+            (
+                config.tenant_id,
+                config.client_id,
+                config.client_secret,
+                config.from_address,
+                self._recipients,
+            )
         )
 
     def _get_msal_app(self) -> msal.ConfidentialClientApplication:
@@ -68,22 +87,38 @@ class GraphEmailNotificationSender(BaseNotificationSender):
 
     async def _acquire_token(self) -> str:
         """Acquire access token using client credentials flow."""
-        if self._access_token and self._token_expiry and datetime.now(UTC) < self._token_expiry:
+        token = self._valid_token()
+        if token is not None:
+            return token
+
+        # Serialize refreshes so concurrent sends share a single MSAL round trip
+        async with self._token_lock:
+            token = self._valid_token()
+            if token is not None:
+                return token
+
+            app = self._get_msal_app()
+            # MSAL is synchronous; keep the event loop free during the HTTPS round trip
+            result = await asyncio.to_thread(app.acquire_token_for_client, scopes=self.SCOPE)
+
+            if "access_token" not in result:
+                error = result.get("error_description", result.get("error", "Unknown error"))
+                msg = f"Failed to acquire access token: {error}"
+                raise RuntimeError(msg)
+
+            access_token: str = result["access_token"]
+            expires_in = result.get("expires_in", 3600)
+            # Refresh 5 minutes before expiry
+            self._token_expiry = time.monotonic() + expires_in - 300
+            self._access_token = access_token
+
+            return access_token
+
+    def _valid_token(self) -> str | None:
+        """Get the cached access token unless it is due for refresh."""
+        if self._access_token and time.monotonic() < self._token_expiry:
             return self._access_token
-
-        app = self._get_msal_app()
-        result = app.acquire_token_for_client(scopes=self.SCOPE)
-
-        if "access_token" not in result:
-            error = result.get("error_description", result.get("error", "Unknown error"))
-            msg = f"Failed to acquire access token: {error}"
-            raise RuntimeError(msg)
-
-        self._access_token = result["access_token"]
-        expires_in = result.get("expires_in", 3600)
-        self._token_expiry = datetime.now(UTC) + timedelta(seconds=expires_in - 300)
-
-        return self._access_token
+        return None
 
     async def send(self, report: ExpirationReport) -> bool:
         """Send email notification via Graph API."""
@@ -101,9 +136,10 @@ class GraphEmailNotificationSender(BaseNotificationSender):
                 "Content-Type": "application/json",
             }
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, headers=headers, json=message)
-                response.raise_for_status()
+            response = await self._get_http_client().post(
+                url, headers=headers, content=orjson.dumps(message)
+            )
+            response.raise_for_status()
 
             self._logger.info("Graph email sent to %s", self._config.to_addresses)
             return True
@@ -114,110 +150,14 @@ class GraphEmailNotificationSender(BaseNotificationSender):
 
     def _build_message(self, report: ExpirationReport) -> dict[str, Any]:
         """Build the Graph API email message payload."""
-        recipients = [
-            {"emailAddress": {"address": addr.strip()}}
-            for addr in self._config.to_addresses.split(",")
-        ]
-
         return {
             "message": {
-                "subject": self._format_subject(report),
+                "subject": format_subject(report),
                 "body": {
                     "contentType": "HTML",
-                    "content": self._format_html_body(report),
+                    "content": format_html_body(report, *credentials_by_source(report)),
                 },
-                "toRecipients": recipients,
+                "toRecipients": self._recipients,
             },
             "saveToSentItems": self._config.save_to_sent_items,
         }
-
-    def _format_subject(self, report: ExpirationReport) -> str:
-        """Format email subject line."""
-        prefix = {
-            NotificationLevel.CRITICAL: "[CRITICAL]",
-            NotificationLevel.WARNING: "[WARNING]",
-            NotificationLevel.INFO: "[INFO]",
-        }.get(report.notification_level, "")
-
-        return f"{prefix} Entra ID Secrets Alert - {report.get_summary()}"
-
-    def _format_html_body(self, report: ExpirationReport) -> str:
-        """Format HTML email body."""
-        color = report.notification_level.color_hex
-
-        sections_html = ""
-
-        # App Registration section
-        app_creds = report.get_credentials_by_source(CredentialSource.APP_REGISTRATION)
-        if app_creds:
-            sections_html += self._build_source_section_html(
-                report, app_creds, "App Registrations", "#0078D4"
-            )
-
-        # Service Principal section
-        sp_creds = report.get_credentials_by_source(CredentialSource.SERVICE_PRINCIPAL)
-        if sp_creds:
-            sections_html += self._build_source_section_html(
-                report, sp_creds, "Service Principals", "#5C2D91"
-            )
-
-        return f"""<!DOCTYPE html>
-<html>
-<head>
-<style>
-body {{ font-family: Arial, sans-serif; margin: 20px; }}
-.header {{ background-color: {color}; color: white; padding: 15px; border-radius: 5px; }}
-.summary {{ background-color: #f8f9fa; padding: 15px; margin: 15px 0; border-radius: 5px; }}
-.section-header {{ background-color: #e9ecef; padding: 10px 15px; margin-top: 20px; border-radius: 5px; }}
-table {{ border-collapse: collapse; width: 100%; margin: 15px 0; }}
-th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-th {{ background-color: #4CAF50; color: white; }}
-tr:nth-child(even) {{ background-color: #f2f2f2; }}
-a {{ color: #0066cc; text-decoration: none; }}
-a:hover {{ text-decoration: underline; }}
-.footer {{ margin-top: 20px; font-size: 12px; color: #6c757d; }}
-</style>
-</head>
-<body>
-<div class="header"><h1>Entra ID Secrets Alert</h1></div>
-<div class="summary">
-<h2>{report.get_summary()}</h2>
-<p>Applications Affected: {report.affected_applications_count}</p>
-<p>Expired: {report.expired_count} | Critical: {report.critical_count} | Warning: {report.warning_count}</p>
-</div>
-{sections_html}
-<div class="footer"><p>Entra ID Secrets Notification System</p></div>
-</body>
-</html>"""
-
-    def _build_source_section_html(
-        self,
-        report: ExpirationReport,
-        credentials: list[Credential],
-        title: str,
-        header_color: str,
-    ) -> str:
-        """Build HTML section for a credential source."""
-        rows = ""
-        sorted_creds = sorted(credentials, key=lambda c: c.days_until_expiry)
-        for cred in sorted_creds[:15]:
-            status = cred.get_status(report.thresholds).value.upper()
-            name = cred.display_name or str(cred.id)[:8]
-            expiry = cred.expiry_date.strftime("%Y-%m-%d")
-            portal_url = cred.azure_portal_url
-            rows += f"<tr><td>{cred.application_name}</td><td>{cred.credential_type}</td>"
-            rows += f"<td>{name}</td><td>{expiry}</td><td>{status}</td>"
-            rows += f'<td><a href="{portal_url}" target="_blank">Manage</a></td></tr>\n'
-
-        if len(sorted_creds) > 15:
-            rows += f'<tr><td colspan="6">... and {len(sorted_creds) - 15} more</td></tr>\n'
-
-        return f"""
-<div class="section-header">
-<h3 style="margin: 0; color: {header_color};">{title}</h3>
-</div>
-<table>
-<tr><th>Application</th><th>Type</th><th>Name</th><th>Expiry</th><th>Status</th><th>Action</th></tr>
-{rows}
-</table>
-"""
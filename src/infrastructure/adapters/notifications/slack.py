@@ -3,15 +3,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
-import httpx
+import orjson
 
 from ....domain.value_objects import CredentialSource, ExpirationStatus
 from .base import BaseNotificationSender
 
 if TYPE_CHECKING:
-    from ....domain.entities import Credential, ExpirationReport
+    from ....domain.entities import ExpirationReport
+
+_SOURCE_HEADINGS: tuple[tuple[CredentialSource, str], ...] = (
+    (CredentialSource.APP_REGISTRATION, "*📦 APP REGISTRATIONS*"),
+    (CredentialSource.SERVICE_PRINCIPAL, "*🔧 SERVICE PRINCIPALS*"),
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -25,6 +31,8 @@ class SlackConfig:
 class SlackNotificationSender(BaseNotificationSender):
     """Send notifications to Slack via incoming webhook."""
 
+    __slots__ = ("_config",)
+
     def __init__(self, config: SlackConfig) -> None:
         """Initialize the Slack sender."""
         super().__init__()
@@ -43,13 +51,12 @@ class SlackNotificationSender(BaseNotificationSender):
         try:
             message = self._build_slack_message(report)
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    self._config.webhook_url,
-                    json=message,
-                    headers={"Content-Type": "application/json"},
-                )
-                response.raise_for_status()
+            response = await self._get_http_client().post(
+                self._config.webhook_url,
+                content=orjson.dumps(message),
+                headers={"Content-Type": "application/json"},
+            )
+            response.raise_for_status()
 
             self._logger.info("Slack notification sent")
             return True
@@ -60,8 +67,9 @@ class SlackNotificationSender(BaseNotificationSender):
 
     def _build_slack_message(self, report: ExpirationReport) -> dict[str, Any]:
         """Build a Slack message using Block Kit."""
-        emoji = report.notification_level.emoji
-        color = report.notification_level.color_hex
+        level = report.notification_level
+        emoji = level.emoji
+        color = level.color_hex
 
         blocks: list[dict[str, Any]] = [
             {
@@ -97,43 +105,18 @@ class SlackNotificationSender(BaseNotificationSender):
             },
         ]
 
-        # Add App Registration section
-        app_creds = report.get_credentials_by_source(CredentialSource.APP_REGISTRATION)
-        if app_creds:
-            blocks.append({"type": "divider"})
-            blocks.append(
-                {
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": "*📦 APP REGISTRATIONS*"},
-                }
-            )
-            details = self._build_source_details(report, app_creds)
-            if details:
-                blocks.append(
-                    {
-                        "type": "section",
-                        "text": {"type": "mrkdwn", "text": details},
-                    }
-                )
-
-        # Add Service Principal section
-        sp_creds = report.get_credentials_by_source(CredentialSource.SERVICE_PRINCIPAL)
-        if sp_creds:
+        # Add a section per source, skipping sources with nothing requiring attention
+        for source, heading in _SOURCE_HEADINGS:
+            if not report.has_credentials_for_source(source):
+                continue
             blocks.append({"type": "divider"})
+            blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": heading}})
             blocks.append(
                 {
                     "type": "section",
-                    "text": {"type": "mrkdwn", "text": "*🔧 SERVICE PRINCIPALS*"},
+                    "text": {"type": "mrkdwn", "text": self._build_source_details(report, source)},
                 }
             )
-            details = self._build_source_details(report, sp_creds)
-            if details:
-                blocks.append(
-                    {
-                        "type": "section",
-                        "text": {"type": "mrkdwn", "text": details},
-                    }
-                )
 
         blocks.append({"type": "divider"})
         blocks.append(
@@ -148,23 +131,19 @@ class SlackNotificationSender(BaseNotificationSender):
             "attachments": [{"color": color, "blocks": []}],
         }
 
-    def _build_source_details(self, report: ExpirationReport, credentials: list[Credential]) -> str:
+    def _build_source_details(self, report: ExpirationReport, source: CredentialSource) -> str:
         """Build details text for a specific credential source."""
         parts: list[str] = []
 
-        expired = [
-            c for c in credentials if c.get_status(report.thresholds) == ExpirationStatus.EXPIRED
-        ]
-        critical = [
-            c for c in credentials if c.get_status(report.thresholds) == ExpirationStatus.CRITICAL
-        ]
-        warning = [
-            c for c in credentials if c.get_status(report.thresholds) == ExpirationStatus.WARNING
-        ]
+        # Group by status using the report's precomputed source/status index
+        by_status = report.get_credentials_by_source_and_status
+        expired = by_status(source, ExpirationStatus.EXPIRED)
+        critical = by_status(source, ExpirationStatus.CRITICAL)
+        warning = by_status(source, ExpirationStatus.WARNING)
 
         if expired:
             parts.append("*🔴 Expired:*")
-            for cred in expired[:3]:
+            for cred in islice(expired, 3):
                 name = cred.display_name or str(cred.id)[:8]
                 parts.append(
                     f"• `{cred.application_name}` - {cred.credential_type} _{name}_ "
@@ -173,7 +152,7 @@ class SlackNotificationSender(BaseNotificationSender):
 
         if critical:
             parts.append("\n*🟠 Critical (≤7 days):*")
-            for cred in critical[:3]:
+            for cred in islice(critical, 3):
                 name = cred.display_name or str(cred.id)[:8]
                 parts.append(
                     f"• `{cred.application_name}` - _{name}_ ({cred.days_until_expiry}d) "
@@ -182,7 +161,7 @@ class SlackNotificationSender(BaseNotificationSender):
 
         if warning:
             parts.append("\n*🟡 Warning (≤30 days):*")
-            for cred in warning[:3]:
+            for cred in islice(warning, 3):
                 name = cred.display_name or str(cred.id)[:8]
                 parts.append(
                     f"• `{cred.application_name}` - _{name}_ ({cred.days_until_expiry}d) "
@@ -3,16 +3,88 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
-import httpx
+import orjson
 
-from ....domain.value_objects import CredentialSource, ExpirationStatus
+from ....domain.value_objects import CredentialSource, ExpirationStatus, NotificationLevel
 from .base import BaseNotificationSender
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from ....domain.entities import Credential, ExpirationReport
 
+_SOURCE_SECTIONS: tuple[tuple[CredentialSource, str, str], ...] = (
+    (CredentialSource.APP_REGISTRATION, "App Registrations", "#0078D4"),
+    (CredentialSource.SERVICE_PRINCIPAL, "Service Principals", "#5C2D91"),
+)
+
+# Invariant parts of the message envelope; each card copies them and adds its body
+_ATTACHMENT: dict[str, str] = {
+    "contentType": "application/vnd.microsoft.card.adaptive",
+    "contentVersion": "1.4",
+}
+_CARD: dict[str, str] = {
+    "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
+    "type": "AdaptiveCard",
+    "version": "1.4",
+}
+
+# Card blocks below are shared by reference between every card built, so they are typed
+# as read-only mappings and card output must only ever be serialized, never mutated
+
+# The card header only varies by notification level, so one is prebuilt per level
+_HEADER_CONTAINERS: Mapping[NotificationLevel, Mapping[str, Any]] = {
+    level: {
+        "type": "Container",
+        "style": "emphasis",
+        "items": [
+            {
+                "type": "TextBlock",
+                "text": f"{level.emoji} Entra ID Secrets Alert",
+                "weight": "Bolder",
+                "size": "Large",
+                "wrap": True,
+            }
+        ],
+    }
+    for level in NotificationLevel
+}
+
+# Status headers are shared by every section; only the credential lines are built per card
+_EXPIRED_HEADER: Mapping[str, Any] = {
+    "type": "TextBlock",
+    "text": "🔴 **Expired:**",
+    "wrap": True,
+    "weight": "Bolder",
+}
+_CRITICAL_HEADER: Mapping[str, Any] = {
+    "type": "TextBlock",
+    "text": "🟠 **Critical (≤7 days):**",
+    "wrap": True,
+    "weight": "Bolder",
+    "spacing": "Medium",
+}
+_WARNING_HEADER: Mapping[str, Any] = {
+    "type": "TextBlock",
+    "text": "🟡 **Warning (≤30 days):**",
+    "wrap": True,
+    "weight": "Bolder",
+    "spacing": "Medium",
+}
+
+
+def _display_name(cred: Credential) -> str:
+    """Get the credential display name, falling back to a short ID."""
+    return cred.display_name or str(cred.id)[:8]
+
+
+def _detail_item(text: str) -> dict[str, Any]:
+    """Build a compact TextBlock for one credential line."""
+    return {"type": "TextBlock", "text": text, "wrap": True, "spacing": "None"}
+
 
 @dataclass(frozen=True, slots=True)
 class TeamsConfig:
@@ -25,6 +97,8 @@ class TeamsConfig:
 class TeamsNotificationSender(BaseNotificationSender):
     """Send notifications to Microsoft Teams via incoming webhook."""
 
+    __slots__ = ("_config",)
+
     def __init__(self, config: TeamsConfig) -> None:
         """Initialize the Teams sender."""
         super().__init__()
@@ -43,13 +117,12 @@ class TeamsNotificationSender(BaseNotificationSender):
         try:
             card = self._build_adaptive_card(report)
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    self._config.webhook_url,
-                    json=card,
-                    headers={"Content-Type": "application/json"},
-                )
-                response.raise_for_status()
+            response = await self._get_http_client().post(
+                self._config.webhook_url,
+                content=orjson.dumps(card),
+                headers={"Content-Type": "application/json"},
+            )
+            response.raise_for_status()
 
             self._logger.info("Teams notification sent")
             return True
@@ -59,9 +132,12 @@ class TeamsNotificationSender(BaseNotificationSender):
             return False
 
     def _build_adaptive_card(self, report: ExpirationReport) -> dict[str, Any]:
-        """Build an Adaptive Card for Teams."""
-        emoji = report.notification_level.emoji
+        """
+        Build an Adaptive Card for Teams.
 
+        The card embeds the module-level header blocks by reference, so it must be
+        serialized as-is rather than modified.
+        """
         facts = [
             {"title": "Applications Affected", "value": str(report.affected_applications_count)},
             {"title": "Expired", "value": str(report.expired_count)},
@@ -69,20 +145,8 @@ class TeamsNotificationSender(BaseNotificationSender):
             {"title": "Warning", "value": str(report.warning_count)},
         ]
 
-        body_items: list[dict[str, Any]] = [
-            {
-                "type": "Container",
-                "style": "emphasis",
-                "items": [
-                    {
-                        "type": "TextBlock",
-                        "text": f"{emoji} Entra ID Secrets Alert",
-                        "weight": "Bolder",
-                        "size": "Large",
-                        "wrap": True,
-                    }
-                ],
-            },
+        body_items: list[Mapping[str, Any]] = [
+            _HEADER_CONTAINERS[report.notification_level],
             {
                 "type": "TextBlock",
                 "text": report.get_summary(),
@@ -92,45 +156,25 @@ class TeamsNotificationSender(BaseNotificationSender):
             {"type": "FactSet", "facts": facts},
         ]
 
-        # Add App Registration section
-        app_creds = report.get_credentials_by_source(CredentialSource.APP_REGISTRATION)
-        if app_creds:
-            body_items.extend(
-                self._build_source_section(report, app_creds, "App Registrations", "#0078D4")
-            )
-
-        # Add Service Principal section
-        sp_creds = report.get_credentials_by_source(CredentialSource.SERVICE_PRINCIPAL)
-        if sp_creds:
-            body_items.extend(
-                self._build_source_section(report, sp_creds, "Service Principals", "#5C2D91")
-            )
+        # Add a section per source, skipping sources with nothing requiring attention
+        for source, title, color in _SOURCE_SECTIONS:
+            if report.has_credentials_for_source(source):
+                body_items.extend(self._build_source_section(report, source, title, color))
 
         return {
             "type": "message",
-            "attachments": [
-                {
-                    "contentType": "application/vnd.microsoft.card.adaptive",
-                    "contentVersion": "1.4",
-                    "content": {
-                        "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
-                        "type": "AdaptiveCard",
-                        "version": "1.4",
-                        "body": body_items,
-                    },
-                }
-            ],
+            "attachments": [{**_ATTACHMENT, "content": {**_CARD, "body": body_items}}],
         }
 
     def _build_source_section(
         self,
         report: ExpirationReport,
-        credentials: list[Credential],
+        source: CredentialSource,
         title: str,
         _color: str,
-    ) -> list[dict[str, Any]]:
+    ) -> list[Mapping[str, Any]]:
         """Build Adaptive Card section for a credential source."""
-        items: list[dict[str, Any]] = [
+        items: list[Mapping[str, Any]] = [
             {
                 "type": "TextBlock",
                 "text": f"**{title}**",
@@ -142,80 +186,31 @@ class TeamsNotificationSender(BaseNotificationSender):
             },
         ]
 
-        # Group by status
-        expired = [
-            c for c in credentials if c.get_status(report.thresholds) == ExpirationStatus.EXPIRED
-        ]
-        critical = [
-            c for c in credentials if c.get_status(report.thresholds) == ExpirationStatus.CRITICAL
-        ]
-        warning = [
-            c for c in credentials if c.get_status(report.thresholds) == ExpirationStatus.WARNING
-        ]
+        # Group by status using the report's precomputed source/status index
+        by_status = report.get_credentials_by_source_and_status
+        expired = by_status(source, ExpirationStatus.EXPIRED)
+        critical = by_status(source, ExpirationStatus.CRITICAL)
+        warning = by_status(source, ExpirationStatus.WARNING)
 
         if expired:
-            items.append(
-                {
-                    "type": "TextBlock",
-                    "text": "🔴 **Expired:**",
-                    "wrap": True,
-                    "weight": "Bolder",
-                }
-            )
-            for cred in expired[:3]:
-                name = cred.display_name or str(cred.id)[:8]
-                items.append(
-                    {
-                        "type": "TextBlock",
-                        "text": f"• {cred.application_name} - {cred.credential_type} '{name}' "
-                        f"[Manage]({cred.azure_portal_url})",
-                        "wrap": True,
-                        "spacing": "None",
-                    }
+            items.append(_EXPIRED_HEADER)
+            items.extend(
+                _detail_item(
+                    f"• {cred.application_name} - {cred.credential_type} '{_display_name(cred)}' "
+                    f"[Manage]({cred.azure_portal_url})"
                 )
-
-        if critical:
-            items.append(
-                {
-                    "type": "TextBlock",
-                    "text": "🟠 **Critical (≤7 days):**",
-                    "wrap": True,
-                    "weight": "Bolder",
-                    "spacing": "Medium",
-                }
+                for cred in islice(expired, 3)
             )
-            for cred in critical[:3]:
-                name = cred.display_name or str(cred.id)[:8]
-                items.append(
-                    {
-                        "type": "TextBlock",
-                        "text": f"• {cred.application_name} - '{name}' ({cred.days_until_expiry}d) "
-                        f"[Manage]({cred.azure_portal_url})",
-                        "wrap": True,
-                        "spacing": "None",
-                    }
-                )
 
-        if warning:
-            items.append(
-                {
-                    "type": "TextBlock",
-                    "text": "🟡 **Warning (≤30 days):**",
-                    "wrap": True,
-                    "weight": "Bolder",
-                    "spacing": "Medium",
-                }
-            )
-            for cred in warning[:3]:
-                name = cred.display_name or str(cred.id)[:8]
-                items.append(
-                    {
-                        "type": "TextBlock",
-                        "text": f"• {cred.application_name} - '{name}' ({cred.days_until_expiry}d) "
-                        f"[Manage]({cred.azure_portal_url})",
-                        "wrap": True,
-                        "spacing": "None",
-                    }
+        for header, credentials in ((_CRITICAL_HEADER, critical), (_WARNING_HEADER, warning)):
+            if credentials:
+                items.append(header)
+                items.extend(
+                    _detail_item(
+                        f"• {cred.application_name} - '{_display_name(cred)}' "
+                        f"({cred.days_until_expiry}d) [Manage]({cred.azure_portal_url})"
+                    )
+                    for cred in islice(credentials, 3)
                 )
 
         return items
@@ -6,14 +6,24 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
-import httpx
+import orjson
 
 from ....domain.value_objects import CredentialSource
 from .base import BaseNotificationSender
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from ....domain.entities import Credential, ExpirationReport
 
+_EVENT_TYPE = "entra_id_secrets_alert"
+_JSON_HEADERS: dict[str, str] = {"Content-Type": "application/json"}
+
+
+def _utc_now() -> datetime:
+    """Get the current time in UTC."""
+    return datetime.now(UTC)
+
 
 @dataclass(frozen=True, slots=True)
 class WebhookConfig:
@@ -26,10 +36,19 @@ class WebhookConfig:
 class WebhookNotificationSender(BaseNotificationSender):
     """Send notifications via generic HTTP webhook with JSON payload."""
 
-    def __init__(self, config: WebhookConfig) -> None:
-        """Initialize the webhook sender."""
+    __slots__ = ("_config", "_now")
+
+    def __init__(self, config: WebhookConfig, *, now: Callable[[], datetime] = _utc_now) -> None:
+        """
+        Initialize the webhook sender.
+
+        Args:
+            config: Webhook configuration.
+            now: Clock used to timestamp payloads.
+        """
         super().__init__()
         self._config = config
+        self._now = now
 
     def is_configured(self) -> bool:
         """Check if webhook is properly configured."""
@@ -42,17 +61,20 @@ class WebhookNotificationSender(BaseNotificationSender):
             return False
 
         try:
-            payload = self._build_payload(report)
-
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    self._config.url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                )
-                response.raise_for_status()
-
-            self._logger.info("Webhook notification sent to %s", self._config.url)
+            # Serialize straight away so the payload dict is freed before the request is sent
+            body = orjson.dumps(self._build_payload(report))
+
+            response = await self._get_http_client().post(
+                self._config.url, content=body, headers=_JSON_HEADERS
+            )
+            response.raise_for_status()
+
+            # Structured fields for JSON log handlers; the text message stays printf-style
+            self._logger.info(
+                "Webhook notification sent to %s",
+                self._config.url,
+                extra={"webhook_url": self._config.url, "status_code": response.status_code},
+            )
             return True
 
         except Exception:
@@ -61,12 +83,17 @@ class WebhookNotificationSender(BaseNotificationSender):
 
     def _build_payload(self, report: ExpirationReport) -> dict[str, Any]:
         """Build the JSON payload for the webhook."""
+        # Format each credential once; the source lists share the dicts of the legacy list.
+        # Looked up by the credential itself, since Graph key IDs may repeat across sources.
+        by_urgency = report.get_credentials_sorted_by_urgency()
+        legacy = [self._format_credential(report, cred) for cred in by_urgency]
+        formatted = dict(zip(by_urgency, legacy, strict=True))
         app_creds = report.get_credentials_by_source(CredentialSource.APP_REGISTRATION)
         sp_creds = report.get_credentials_by_source(CredentialSource.SERVICE_PRINCIPAL)
 
         return {
-            "event_type": "entra_id_secrets_alert",
-            "timestamp": datetime.now(UTC).isoformat(),
+            "event_type": _EVENT_TYPE,
+            "timestamp": self._now().isoformat(),
             "level": report.notification_level.value,
             "summary": report.get_summary(),
             "statistics": {
@@ -80,36 +107,30 @@ class WebhookNotificationSender(BaseNotificationSender):
             "app_registrations": {
                 "summary": report.get_source_summary(CredentialSource.APP_REGISTRATION),
                 "counts": report.get_source_counts(CredentialSource.APP_REGISTRATION),
-                "credentials": self._format_credentials(report, app_creds),
+                "credentials": [formatted[cred] for cred in app_creds],
             },
             "service_principals": {
                 "summary": report.get_source_summary(CredentialSource.SERVICE_PRINCIPAL),
                 "counts": report.get_source_counts(CredentialSource.SERVICE_PRINCIPAL),
-                "credentials": self._format_credentials(report, sp_creds),
+                "credentials": [formatted[cred] for cred in sp_creds],
             },
             # Keep legacy field for backward compatibility
-            "credentials": self._format_credentials(
-                report, report.get_credentials_sorted_by_urgency()
-            ),
+            "credentials": legacy,
         }
 
-    def _format_credentials(
-        self, report: ExpirationReport, credentials: list[Credential]
-    ) -> list[dict[str, Any]]:
-        """Format credentials list for JSON payload."""
-        return [
-            {
-                "application_id": str(cred.application_id),
-                "application_name": cred.application_name,
-                "credential_id": str(cred.id),
-                "credential_type": str(cred.credential_type),
-                "display_name": cred.display_name,
-                "expiry_date": cred.expiry_date.isoformat(),
-                "days_until_expiry": cred.days_until_expiry,
-                "is_expired": cred.is_expired,
-                "status": cred.get_status(report.thresholds).value,
-                "source": str(cred.source),
-                "azure_portal_url": cred.azure_portal_url,
-            }
-            for cred in credentials
-        ]
+    def _format_credential(self, report: ExpirationReport, cred: Credential) -> dict[str, Any]:
+        """Format a single credential for the JSON payload."""
+        # UUIDs, datetimes and string enums are left for orjson to serialize natively
+        return {
+            "application_id": cred.application_id,
+            "application_name": cred.application_name,
+            "credential_id": cred.id,
+            "credential_type": cred.credential_type,
+            "display_name": cred.display_name,
+            "expiry_date": cred.expiry_date,
+            "days_until_expiry": cred.days_until_expiry,
+            "is_expired": cred.is_expired,
+            "status": report.get_status(cred),
+            "source": cred.source,
+            "azure_portal_url": cred.azure_portal_url,
+        }
@@ -2,7 +2,7 @@
 
 import os
 from dataclasses import dataclass, field
-from functools import cached_property
+from functools import lru_cache
 
 from ...domain.value_objects import ExpirationThresholds
 from ..adapters.entra_id.graph_client import GraphClientConfig
@@ -12,15 +12,22 @@ from ..adapters.notifications.slack import SlackConfig
 from ..adapters.notifications.teams import TeamsConfig
 from ..adapters.notifications.webhook import WebhookConfig
 
+# Common casings are enumerated so lookups need no str.lower() allocation
+_TRUE_VALUES = frozenset(
+    {"true", "True", "TRUE", "1", "yes", "Yes", "YES", "on", "On", "ON"},
+)
+
 
 def _env_bool(key: str, default: bool = False) -> bool:
     """Get boolean from environment variable."""
-    return os.environ.get(key, str(default)).lower() in ("true", "1", "yes")
+    value = os.environ.get(key)
+    return default if value is None else value in _TRUE_VALUES
 
 
 def _env_int(key: str, default: int) -> int:
     """Get integer from environment variable."""
-    return int(os.environ.get(key, str(default)))
+    value = os.environ.get(key)
+    return default if value is None else int(value)
 
 
 def _env_str(key: str, default: str = "") -> str:
@@ -28,7 +35,7 @@ def _env_str(key: str, default: str = "") -> str:
     return os.environ.get(key, default)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Application settings container."""
 
@@ -97,6 +104,25 @@ class Settings:
     api_host: str = field(default_factory=lambda: _env_str("API_HOST", "0.0.0.0"))  # noqa: S104
     api_port: int = field(default_factory=lambda: _env_int("API_PORT", 8080))
 
+    # Component configurations derived from the settings above
+    graph_config: GraphClientConfig = field(init=False, repr=False)
+    thresholds: ExpirationThresholds = field(init=False, repr=False)
+    email_config: EmailConfig = field(init=False, repr=False)
+    teams_config: TeamsConfig = field(init=False, repr=False)
+    slack_config: SlackConfig = field(init=False, repr=False)
+    webhook_config: WebhookConfig = field(init=False, repr=False)
+    graph_email_config: GraphEmailConfig = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Build the component configurations once."""
+        object.__setattr__(self, "graph_config", self._build_graph_config())
+        object.__setattr__(self, "thresholds", self._build_thresholds())
+        object.__setattr__(self, "email_config", self._build_email_config())
+        object.__setattr__(self, "teams_config", self._build_teams_config())
+        object.__setattr__(self, "slack_config", self._build_slack_config())
+        object.__setattr__(self, "webhook_config", self._build_webhook_config())
+        object.__setattr__(self, "graph_email_config", self._build_graph_email_config())
+
     def validate(self) -> None:
         """Validate required settings."""
         missing: list[str] = []
@@ -112,27 +138,24 @@ class Settings:
             msg = f"Missing required environment variables: {', '.join(missing)}"
             raise ValueError(msg)
 
-    @cached_property
-    def graph_config(self) -> GraphClientConfig:
-        """Get Graph API client configuration."""
+    def _build_graph_config(self) -> GraphClientConfig:
+        """Build Graph API client configuration."""
         return GraphClientConfig(
             tenant_id=self.azure_tenant_id,
             client_id=self.azure_client_id,
             client_secret=self.azure_client_secret,
         )
 
-    @cached_property
-    def thresholds(self) -> ExpirationThresholds:
-        """Get expiration thresholds."""
+    def _build_thresholds(self) -> ExpirationThresholds:
+        """Build expiration thresholds."""
         return ExpirationThresholds(
             critical=self.critical_threshold_days,
             warning=self.warning_threshold_days,
             info=self.info_threshold_days,
         )
 
-    @cached_property
-    def email_config(self) -> EmailConfig:
-        """Get email configuration."""
+    def _build_email_config(self) -> EmailConfig:
+        """Build email configuration."""
         return EmailConfig(
             enabled=self.smtp_enabled,
             server=self.smtp_server,
@@ -144,33 +167,29 @@ class Settings:
             use_tls=self.smtp_use_tls,
         )
 
-    @cached_property
-    def teams_config(self) -> TeamsConfig:
-        """Get Teams configuration."""
+    def _build_teams_config(self) -> TeamsConfig:
+        """Build Teams configuration."""
         return TeamsConfig(
             enabled=self.teams_enabled,
             webhook_url=self.teams_webhook_url,
         )
 
-    @cached_property
-    def slack_config(self) -> SlackConfig:
-        """Get Slack configuration."""
+    def _build_slack_config(self) -> SlackConfig:
+        """Build Slack configuration."""
         return SlackConfig(
             enabled=self.slack_enabled,
             webhook_url=self.slack_webhook_url,
         )
 
-    @cached_property
-    def webhook_config(self) -> WebhookConfig:
-        """Get webhook configuration."""
+    def _build_webhook_config(self) -> WebhookConfig:
+        """Build webhook configuration."""
         return WebhookConfig(
             enabled=self.webhook_enabled,
             url=self.webhook_url,
         )
 
-    @cached_property
-    def graph_email_config(self) -> GraphEmailConfig:
-        """Get Graph email configuration."""
+    def _build_graph_email_config(self) -> GraphEmailConfig:
+        """Build Graph email configuration."""
         # Use main Azure credentials if Graph-specific ones not provided
         tenant_id = self.graph_email_tenant_id or self.azure_tenant_id
         client_id = self.graph_email_client_id or self.azure_client_id
@@ -187,8 +206,14 @@ class Settings:
         )
 
 
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
-    """Load and validate settings from environment."""
+    """
+    Load and validate settings from environment.
+
+    The environment is parsed once per process; subsequent calls return the
+    same instance. Use ``load_settings.cache_clear()`` to force a reload.
+    """
     settings = Settings()
     settings.validate()
     return settings
@@ -11,6 +11,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import sys
+from contextlib import suppress
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
@@ -28,8 +29,11 @@ from .infrastructure.adapters import (
 from .infrastructure.config import Settings, load_settings
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from .application.ports import NotificationSender
     from .application.use_cases.check_expiring_credentials import CheckResult
+    from .infrastructure.adapters.notifications import BaseNotificationSender
 
 # Configure logging
 logging.basicConfig(
@@ -53,31 +57,36 @@ class ApplicationContainer:
     def __init__(self, settings: Settings) -> None:
         """Initialize container with settings."""
         self._settings = settings
+        self._repository: EntraIdCredentialRepository | None = None
+        self._senders: list[BaseNotificationSender] | None = None
 
     def create_credential_repository(self) -> EntraIdCredentialRepository:
-        """Create the credential repository adapter."""
-        return EntraIdCredentialRepository(
-            self._settings.graph_config,
-            monitor_service_principals=self._settings.monitor_service_principals,
-        )
+        """Get the credential repository adapter, reusing its pooled Graph connections."""
+        if self._repository is None:
+            self._repository = EntraIdCredentialRepository(
+                self._settings.graph_config,
+                monitor_service_principals=self._settings.monitor_service_principals,
+            )
+        return self._repository
 
     def create_notification_senders(self) -> list[NotificationSender]:
-        """Create all configured notification sender adapters."""
-        senders: list[NotificationSender] = [
-            EmailNotificationSender(self._settings.email_config),
-            GraphEmailNotificationSender(self._settings.graph_email_config),
-            TeamsNotificationSender(self._settings.teams_config),
-            SlackNotificationSender(self._settings.slack_config),
-            WebhookNotificationSender(self._settings.webhook_config),
-        ]
-
-        configured = [s for s in senders if s.is_configured()]
-        logger.info(
-            "Configured notification senders: %s",
-            [s.__class__.__name__ for s in configured] or "None",
-        )
-
-        return senders
+        """Get all notification sender adapters, reusing their connections across checks."""
+        if self._senders is None:
+            self._senders = [
+                EmailNotificationSender(self._settings.email_config),
+                GraphEmailNotificationSender(self._settings.graph_email_config),
+                TeamsNotificationSender(self._settings.teams_config),
+                SlackNotificationSender(self._settings.slack_config),
+                WebhookNotificationSender(self._settings.webhook_config),
+            ]
+
+            configured = [s for s in self._senders if s.is_configured()]
+            logger.info(
+                "Configured notification senders: %s",
+                [s.__class__.__name__ for s in configured] or "None",
+            )
+
+        return list(self._senders)
 
     def create_check_use_case(self) -> CheckExpiringCredentials:
         """Create the main use case with all dependencies."""
@@ -88,6 +97,14 @@ class ApplicationContainer:
             dry_run=self._settings.dry_run,
         )
 
+    async def aclose(self) -> None:
+        """Release network resources held by created adapters."""
+        if self._repository is not None:
+            await self._repository.aclose()
+        if self._senders is not None:
+            for sender in self._senders:
+                await sender.aclose()
+
 
 class Application:
     """
@@ -100,12 +117,27 @@ class Application:
         """Initialize application with settings."""
         self._settings = settings
         self._container = ApplicationContainer(settings)
+        self._token_refresher: asyncio.Task[None] | None = None
 
     async def run_once(self) -> CheckResult:
         """Execute a single credential check."""
         use_case = self._container.create_check_use_case()
         return await use_case.execute()
 
+    async def start_token_refresh(self) -> None:
+        """Keep the Graph API token warm so on-demand checks skip token acquisition."""
+        repository = self._container.create_credential_repository()
+        self._token_refresher = asyncio.create_task(repository.keep_token_fresh())
+
+    async def aclose(self) -> None:
+        """Release resources held by the application."""
+        if self._token_refresher is not None:
+            self._token_refresher.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._token_refresher
+            self._token_refresher = None
+        await self._container.aclose()
+
     async def run_scheduled(self) -> None:
         """Run in scheduled mode with cron expression."""
         logger.info("Starting scheduled mode with cron: %s", self._settings.cron_schedule)
@@ -149,6 +181,8 @@ class Application:
         app = create_app(
             check_func=self.run_once,
             version=__version__,
+            on_startup=self.start_token_refresh,
+            on_shutdown=self.aclose,
         )
 
         # Run uvicorn server
@@ -198,7 +232,10 @@ async def async_main() -> int:
         logging.getLogger().setLevel(settings.log_level.upper())
 
         app = Application(settings)
-        return await app.run()
+        try:
+            return await app.run()
+        finally:
+            await app.aclose()
 
     except ValueError as e:
         logger.error("Configuration error: %s", e)
@@ -211,9 +248,18 @@ async def async_main() -> int:
         return 1
 
 
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Get the uvloop event loop factory if available, else use the default loop."""
+    try:
+        import uvloop  # Installed with uvicorn[standard] on supported platforms
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 def main() -> None:
     """Main entry point."""
-    exit_code = asyncio.run(async_main())
+    exit_code = asyncio.run(async_main(), loop_factory=_event_loop_factory())
     sys.exit(exit_code)
 
 
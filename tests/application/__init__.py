@@ -0,0 +1 @@
+"""Application layer tests."""
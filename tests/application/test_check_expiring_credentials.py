@@ -0,0 +1,127 @@
+"""Tests for CheckExpiringCredentials use case."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from src.application.use_cases import CheckExpiringCredentials
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    import pytest
+
+    from src.domain.entities import Credential, ExpirationReport
+    from src.domain.value_objects import ExpirationThresholds
+
+
+class FakeRepository:
+    """In-memory credential repository."""
+
+    def __init__(self, credentials: list[Credential]) -> None:
+        self._credentials = credentials
+
+    async def get_all_credentials(self) -> list[Credential]:
+        return self._credentials
+
+    async def get_credentials_stream(self) -> AsyncIterator[Credential]:
+        for credential in self._credentials:
+            yield credential
+
+
+class FakeSender:
+    """Notification sender recording calls."""
+
+    def __init__(
+        self,
+        *,
+        result: bool = True,
+        error: bool = False,
+        barrier: asyncio.Barrier | None = None,
+    ) -> None:
+        self.result = result
+        self.error = error
+        self.barrier = barrier
+        self.calls = 0
+
+    async def send(self, report: ExpirationReport) -> bool:  # noqa: ARG002
+        self.calls += 1
+        if self.barrier is not None:
+            # Only passes once every sender is waiting; a sequential run times out
+            async with asyncio.timeout(1):
+                await self.barrier.wait()
+        if self.error:
+            msg = "boom"
+            raise RuntimeError(msg)
+        return self.result
+
+    def is_configured(self) -> bool:
+        return True
+
+
+class TestCheckExpiringCredentials:
+    """Tests for CheckExpiringCredentials."""
+
+    async def test_tallies_sent_and_failed(
+        self, expired_credential: Credential, default_thresholds: ExpirationThresholds
+    ) -> None:
+        """Successful, failing and raising senders should be tallied separately."""
+        senders = [FakeSender(), FakeSender(result=False), FakeSender(error=True)]
+        use_case = CheckExpiringCredentials(
+            FakeRepository([expired_credential]), senders, default_thresholds
+        )
+
+        result = await use_case.execute()
+
+        assert result.notifications_sent == 1
+        assert result.notifications_failed == 2
+        assert all(s.calls == 1 for s in senders)
+
+    async def test_senders_run_concurrently(
+        self, expired_credential: Credential, default_thresholds: ExpirationThresholds
+    ) -> None:
+        """Senders should be awaited concurrently rather than one after another."""
+        barrier = asyncio.Barrier(4)
+        senders = [FakeSender(barrier=barrier) for _ in range(4)]
+        use_case = CheckExpiringCredentials(
+            FakeRepository([expired_credential]), senders, default_thresholds
+        )
+
+        result = await use_case.execute()
+
+        assert result.notifications_sent == 4
+        assert result.notifications_failed == 0
+
+    async def test_no_notifications_for_healthy_report(
+        self, healthy_credential: Credential, default_thresholds: ExpirationThresholds
+    ) -> None:
+        """Senders should not be called when nothing requires attention."""
+        sender = FakeSender()
+        use_case = CheckExpiringCredentials(
+            FakeRepository([healthy_credential]), [sender], default_thresholds
+        )
+
+        result = await use_case.execute()
+
+        assert result.notifications_sent == 0
+        assert sender.calls == 0
+
+    async def test_logs_retrieved_credential_count(
+        self,
+        expired_credential: Credential,
+        healthy_credential: Credential,
+        default_thresholds: ExpirationThresholds,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """All retrieved credentials should be counted, not only those kept in the report."""
+        use_case = CheckExpiringCredentials(
+            FakeRepository([expired_credential, healthy_credential]), [], default_thresholds
+        )
+
+        with caplog.at_level(logging.INFO):
+            result = await use_case.execute()
+
+        assert result.report.total_count == 1
+        assert "Retrieved 2 credentials" in caplog.messages
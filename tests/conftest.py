@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import time
 from datetime import UTC, datetime, timedelta
+from typing import Any
 from uuid import uuid4
 
 import pytest
@@ -11,6 +13,25 @@ from src.domain.entities import Credential
 from src.domain.value_objects import CredentialType, ExpirationThresholds
 
 
+class FakeMsalApp:
+    """MSAL application stub issuing numbered tokens after an optional delay."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.calls = 0
+
+    def acquire_token_for_client(self, scopes: list[str]) -> dict[str, Any]:  # noqa: ARG002
+        self.calls += 1
+        time.sleep(self.delay)
+        return {"access_token": f"token-{self.calls}", "expires_in": 3600}
+
+
+@pytest.fixture
+def fake_msal_app(request: pytest.FixtureRequest) -> FakeMsalApp:
+    """MSAL stub; parametrize indirectly with a delay in seconds to slow acquisition."""
+    return FakeMsalApp(delay=getattr(request, "param", 0.0))
+
+
 @pytest.fixture
 def default_thresholds() -> ExpirationThresholds:
     """Default expiration thresholds."""
@@ -0,0 +1,59 @@
+"""Tests for Application entity."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from src.domain.entities import Application
+from src.domain.value_objects import ExpirationThresholds
+
+if TYPE_CHECKING:
+    from src.domain.entities import Credential
+
+
+class TestApplication:
+    """Tests for Application entity."""
+
+    def test_no_credentials_is_not_expiring(self) -> None:
+        """An application without credentials has nothing expiring."""
+        app = Application(id=uuid4(), display_name="Empty")
+
+        assert app.credentials == ()
+        assert app.has_expiring_credentials is False
+
+    def test_initial_credentials_are_tracked(
+        self, healthy_credential: Credential, warning_credential: Credential
+    ) -> None:
+        """Credentials passed at construction should be considered."""
+        app = Application(
+            id=uuid4(),
+            display_name="App",
+            credentials=(healthy_credential, warning_credential),
+        )
+
+        assert app.credentials == (healthy_credential, warning_credential)
+        assert app.has_expiring_credentials is True
+
+    def test_add_credential_updates_tracking(
+        self, healthy_credential: Credential, expired_credential: Credential
+    ) -> None:
+        """Adding a more urgent credential should flip the expiring flag."""
+        app = Application(id=uuid4(), display_name="App", credentials=(healthy_credential,))
+        assert app.has_expiring_credentials is False
+
+        app.add_credential(expired_credential)
+
+        assert app.credentials == (healthy_credential, expired_credential)
+        assert app.has_expiring_credentials is True
+
+    def test_uses_custom_info_threshold(self, healthy_credential: Credential) -> None:
+        """The info threshold of the application should decide what is expiring."""
+        app = Application(
+            id=uuid4(),
+            display_name="App",
+            credentials=(healthy_credential,),
+            thresholds=ExpirationThresholds(critical=7, warning=30, info=365),
+        )
+
+        assert app.has_expiring_credentials is True
@@ -5,7 +5,9 @@ from __future__ import annotations
 from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
-from src.domain.entities import Credential
+import pytest
+
+from src.domain.entities import Credential, set_reference_now
 from src.domain.value_objects import CredentialType, ExpirationStatus, ExpirationThresholds
 
 
@@ -115,3 +117,55 @@ class TestCredential:
             f"/ApplicationMenuBlade/~/Credentials/appId/{app_id}"
         )
         assert credential.azure_portal_url == expected_url
+
+    def test_reference_now_is_used_for_days_calculation(self) -> None:
+        """Credentials created under a reference time should be evaluated against it."""
+        reference = datetime(2030, 1, 1, tzinfo=UTC)
+        with set_reference_now(reference):
+            credential = Credential(
+                id=uuid4(),
+                credential_type=CredentialType.PASSWORD,
+                display_name="Test",
+                expiry_date=reference + timedelta(days=10),
+                application_id=uuid4(),
+                application_name="Test App",
+            )
+        assert credential.days_until_expiry == 10
+        assert credential.is_expired is False
+
+    def test_create_with_reference_now(self) -> None:
+        """The create factory should accept an explicit reference time."""
+        reference = datetime(2030, 1, 1, tzinfo=UTC)
+        credential = Credential.create(
+            credential_id=str(uuid4()),
+            credential_type=CredentialType.PASSWORD,
+            display_name=None,
+            expiry_date=reference - timedelta(hours=1),
+            application_id=str(uuid4()),
+            application_name="My App",
+            reference_now=reference,
+        )
+        assert credential.is_expired is True
+        assert credential.days_until_expiry == -1
+
+    def test_credential_is_frozen_and_hashable(self, critical_credential: Credential) -> None:
+        """Credentials should be immutable and usable as set members."""
+        with pytest.raises(AttributeError):
+            critical_credential.display_name = "Changed"  # type: ignore[misc]
+        assert critical_credential in {critical_credential}
+
+    def test_equality_ignores_reference_time(self, critical_credential: Credential) -> None:
+        """The same credential evaluated at different times should compare equal."""
+        with set_reference_now(datetime.now(UTC) + timedelta(days=3)):
+            later = Credential(
+                id=critical_credential.id,
+                credential_type=critical_credential.credential_type,
+                display_name=critical_credential.display_name,
+                expiry_date=critical_credential.expiry_date,
+                application_id=critical_credential.application_id,
+                application_name=critical_credential.application_name,
+            )
+
+        assert later.days_until_expiry != critical_credential.days_until_expiry
+        assert later == critical_credential
+        assert hash(later) == hash(critical_credential)
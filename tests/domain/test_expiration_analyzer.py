@@ -0,0 +1,66 @@
+"""Tests for ExpirationAnalyzer domain service."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.domain.services import ExpirationAnalyzer
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from src.domain.entities import Credential
+    from src.domain.value_objects import ExpirationThresholds
+
+
+class TestExpirationAnalyzer:
+    """Tests for ExpirationAnalyzer."""
+
+    def test_excludes_credentials_beyond_info_threshold(
+        self,
+        expired_credential: Credential,
+        warning_credential: Credential,
+        healthy_credential: Credential,
+        default_thresholds: ExpirationThresholds,
+    ) -> None:
+        """Credentials expiring after the info threshold should not be reported."""
+        analyzer = ExpirationAnalyzer(default_thresholds)
+
+        report = analyzer.analyze([healthy_credential, expired_credential, warning_credential])
+
+        assert report.credentials == [expired_credential, warning_credential]
+        assert report.expired == [expired_credential]
+        assert report.warning == [warning_credential]
+        assert report.healthy == []
+        assert report.requires_notification is True
+
+    def test_report_without_relevant_credentials(
+        self, healthy_credential: Credential, default_thresholds: ExpirationThresholds
+    ) -> None:
+        """A report with nothing in range should not require notification."""
+        report = ExpirationAnalyzer(default_thresholds).analyze([healthy_credential])
+
+        assert report.total_count == 0
+        assert report.requires_notification is False
+        assert report.get_summary() == "All credentials are healthy"
+
+    async def test_analyze_stream_matches_analyze(
+        self,
+        expired_credential: Credential,
+        warning_credential: Credential,
+        healthy_credential: Credential,
+        default_thresholds: ExpirationThresholds,
+    ) -> None:
+        """Streaming analysis should produce the same report as the list-based one."""
+        credentials = [healthy_credential, expired_credential, warning_credential]
+
+        async def stream() -> AsyncIterator[Credential]:
+            for credential in credentials:
+                yield credential
+
+        analyzer = ExpirationAnalyzer(default_thresholds)
+        report = await analyzer.analyze_stream(stream())
+
+        assert report.credentials == analyzer.analyze(credentials).credentials
+        assert report.expired == [expired_credential]
+        assert report.warning == [warning_credential]
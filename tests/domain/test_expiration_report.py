@@ -0,0 +1,164 @@
+"""Tests for ExpirationReport aggregate."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities import Credential, ExpirationReport
+from src.domain.exceptions import CredentialNotFoundError
+from src.domain.value_objects import (
+    CredentialSource,
+    CredentialType,
+    ExpirationStatus,
+    ExpirationThresholds,
+    NotificationLevel,
+)
+
+
+def _credential(
+    days: int,
+    *,
+    source: CredentialSource = CredentialSource.APP_REGISTRATION,
+) -> Credential:
+    return Credential(
+        id=uuid4(),
+        credential_type=CredentialType.PASSWORD,
+        display_name=f"Secret {days}",
+        expiry_date=datetime.now(UTC) + timedelta(days=days, hours=1),
+        application_id=uuid4(),
+        application_name="Test App",
+        source=source,
+    )
+
+
+class TestExpirationReport:
+    """Tests for ExpirationReport."""
+
+    def test_categorizes_credentials_by_status(
+        self,
+        expired_credential: Credential,
+        critical_credential: Credential,
+        warning_credential: Credential,
+        healthy_credential: Credential,
+        default_thresholds: ExpirationThresholds,
+    ) -> None:
+        """Credentials should be bucketed by their expiration status."""
+        report = ExpirationReport(
+            credentials=[
+                expired_credential,
+                critical_credential,
+                warning_credential,
+                healthy_credential,
+            ],
+            thresholds=default_thresholds,
+        )
+
+        assert report.expired == [expired_credential]
+        assert report.critical == [critical_credential]
+        assert report.warning == [warning_credential]
+        assert report.healthy == [healthy_credential]
+        assert report.total_count == 4
+        assert report.get_status(critical_credential) == ExpirationStatus.CRITICAL
+        assert report.affected_applications_count == 3
+        assert report.notification_level == NotificationLevel.CRITICAL
+        assert report.requires_notification is True
+
+    def test_healthy_report(
+        self, healthy_credential: Credential, default_thresholds: ExpirationThresholds
+    ) -> None:
+        """A report without attention-worthy credentials should be quiet."""
+        report = ExpirationReport(credentials=[healthy_credential], thresholds=default_thresholds)
+
+        assert report.requires_notification is False
+        assert report.notification_level == NotificationLevel.INFO
+        assert report.get_summary() == "All credentials are healthy"
+
+    def test_summary(self, default_thresholds: ExpirationThresholds) -> None:
+        """Summary should list only non-empty categories."""
+        report = ExpirationReport(
+            credentials=[_credential(-1), _credential(3), _credential(3), _credential(60)],
+            thresholds=default_thresholds,
+        )
+
+        assert report.get_summary() == (
+            "3 credentials requiring attention: 1 expired, 2 critical, 1 healthy"
+        )
+
+    def test_sorted_by_urgency(self, default_thresholds: ExpirationThresholds) -> None:
+        """Most urgent credentials should come first."""
+        later, sooner, expired = _credential(20), _credential(5), _credential(-3)
+        report = ExpirationReport(
+            credentials=[later, sooner, expired], thresholds=default_thresholds
+        )
+
+        assert report.get_credentials_sorted_by_urgency() == [expired, sooner, later]
+
+    def test_accessor_lists_are_copies(self, default_thresholds: ExpirationThresholds) -> None:
+        """Mutating a returned list should not change what later readers see."""
+        later, expired = _credential(20), _credential(-3)
+        report = ExpirationReport(credentials=[later, expired], thresholds=default_thresholds)
+
+        report.get_credentials_sorted_by_urgency().reverse()
+        report.expired.clear()
+        report.get_credentials_by_source(CredentialSource.APP_REGISTRATION).append(later)
+
+        assert report.get_credentials_sorted_by_urgency() == [expired, later]
+        assert report.expired == [expired]
+        assert report.get_credentials_by_source(CredentialSource.APP_REGISTRATION) == [
+            later,
+            expired,
+        ]
+
+    def test_source_queries(self, default_thresholds: ExpirationThresholds) -> None:
+        """Per-source lookups should only consider credentials of that source."""
+        app_expired = _credential(-1)
+        app_healthy = _credential(60)
+        sp_warning = _credential(20, source=CredentialSource.SERVICE_PRINCIPAL)
+        report = ExpirationReport(
+            credentials=[app_expired, app_healthy, sp_warning],
+            thresholds=default_thresholds,
+        )
+
+        app = CredentialSource.APP_REGISTRATION
+        sp = CredentialSource.SERVICE_PRINCIPAL
+        assert report.get_credentials_by_source(app) == [app_expired, app_healthy]
+        assert report.get_credentials_by_source_and_status(sp, ExpirationStatus.WARNING) == [
+            sp_warning
+        ]
+        assert report.get_credentials_by_source_and_status(sp, ExpirationStatus.EXPIRED) == []
+        assert report.has_credentials_for_source(app) is True
+        assert report.get_source_counts(app) == {
+            "total": 2,
+            "expired": 1,
+            "critical": 0,
+            "warning": 0,
+            "healthy": 1,
+        }
+        assert report.get_source_summary(sp) == "1 credentials requiring attention: 1 warning"
+
+    def test_source_without_credentials(self, default_thresholds: ExpirationThresholds) -> None:
+        """Sources with no credentials should report as such."""
+        report = ExpirationReport(credentials=[_credential(60)], thresholds=default_thresholds)
+        sp = CredentialSource.SERVICE_PRINCIPAL
+
+        assert report.get_credentials_by_source(sp) == []
+        assert report.has_credentials_for_source(sp) is False
+        assert report.get_source_summary(sp) == "No Service Principal credentials"
+        assert report.get_source_counts(sp)["total"] == 0
+
+    def test_status_lookup_is_per_credential(
+        self, default_thresholds: ExpirationThresholds
+    ) -> None:
+        """Credentials sharing a Graph key ID should keep their own status."""
+        app = _credential(-1)
+        sp = replace(_credential(20, source=CredentialSource.SERVICE_PRINCIPAL), id=app.id)
+        report = ExpirationReport(credentials=[app, sp], thresholds=default_thresholds)
+
+        assert report.get_status(app) == ExpirationStatus.EXPIRED
+        assert report.get_status(sp) == ExpirationStatus.WARNING
+        with pytest.raises(CredentialNotFoundError):
+            report.get_status(_credential(5))
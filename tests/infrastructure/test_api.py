@@ -0,0 +1,69 @@
+"""Tests for the FastAPI application."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import httpx
+
+from src.application.use_cases.check_expiring_credentials import CheckResult
+from src.domain.services import ExpirationAnalyzer
+from src.infrastructure.adapters.api import create_app
+
+if TYPE_CHECKING:
+    from src.domain.entities import Credential
+    from src.domain.value_objects import ExpirationThresholds
+
+
+def _client(credentials: list[Credential], thresholds: ExpirationThresholds) -> httpx.AsyncClient:
+    async def check() -> CheckResult:
+        report = ExpirationAnalyzer(thresholds).analyze(credentials)
+        return CheckResult(
+            report=report, notifications_sent=1, notifications_failed=0, dry_run=False
+        )
+
+    app = create_app(check_func=check, version="9.9.9")
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+class TestApi:
+    """Tests for API endpoints."""
+
+    async def test_health(self, default_thresholds: ExpirationThresholds) -> None:
+        """Health endpoint should report status, version and a UTC timestamp."""
+        async with _client([], default_thresholds) as client:
+            response = await client.get("/health")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        body = response.json()
+        assert body["status"] == "healthy"
+        assert body["version"] == "9.9.9"
+        assert body["timestamp"].endswith("Z")
+
+    async def test_report_not_available_before_check(
+        self, default_thresholds: ExpirationThresholds
+    ) -> None:
+        """Report endpoint should return 404 until a check has run."""
+        async with _client([], default_thresholds) as client:
+            response = await client.get("/api/v1/report")
+
+        assert response.status_code == 404
+
+    async def test_report_matches_last_check(
+        self,
+        expired_credential: Credential,
+        warning_credential: Credential,
+        default_thresholds: ExpirationThresholds,
+    ) -> None:
+        """Report endpoint should return the report produced by the last check."""
+        async with _client([expired_credential, warning_credential], default_thresholds) as client:
+            check = await client.post("/api/v1/check")
+            report = await client.get("/api/v1/report")
+
+        assert check.status_code == 200
+        assert check.json()["notifications_sent"] == 1
+        assert report.status_code == 200
+        assert report.json() == check.json()["report"]
+        assert report.json()["statistics"]["expired_count"] == 1
+        assert report.json()["notification_level"] == "critical"
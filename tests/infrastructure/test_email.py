@@ -0,0 +1,203 @@
+"""Tests for SMTP email notification sender."""
+
+from __future__ import annotations
+
+import smtplib
+from dataclasses import replace
+from email import message_from_bytes
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import pytest
+
+from src.domain.services import ExpirationAnalyzer
+from src.infrastructure.adapters.notifications import email
+from src.infrastructure.adapters.notifications.email import (
+    EmailConfig,
+    EmailNotificationSender,
+)
+from src.infrastructure.adapters.notifications.email_format import (
+    credentials_by_source,
+    format_html_body,
+    format_subject,
+)
+
+if TYPE_CHECKING:
+    from src.domain.entities import Credential, ExpirationReport
+    from src.domain.value_objects import ExpirationThresholds
+
+
+class FakeSMTP:
+    """In-memory SMTP connection recording what the sender does."""
+
+    instances: ClassVar[list[FakeSMTP]] = []
+
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        self.logins = 0
+        self.sent: list[tuple[str, tuple[str, ...], bytes]] = []
+        self.connected = True
+        self.disconnect_after_data = False
+        self.instances.append(self)
+
+    def starttls(self) -> None:
+        pass
+
+    def login(self, user: str, password: str) -> None:  # noqa: ARG002
+        self.logins += 1
+
+    def noop(self) -> tuple[int, bytes]:
+        if not self.connected:
+            raise smtplib.SMTPServerDisconnected
+        return 250, b"OK"
+
+    def sendmail(self, from_addr: str, to_addrs: tuple[str, ...], msg: bytes) -> dict[str, Any]:
+        self.sent.append((from_addr, to_addrs, msg))
+        if self.disconnect_after_data:
+            self.connected = False
+            raise smtplib.SMTPServerDisconnected
+        return {}
+
+    def quit(self) -> None:
+        self.connected = False
+
+    def close(self) -> None:
+        self.connected = False
+
+
+@pytest.fixture
+def fake_smtp(monkeypatch: pytest.MonkeyPatch) -> list[FakeSMTP]:
+    """Replace smtplib.SMTP with FakeSMTP and return the created connections."""
+    FakeSMTP.instances = []
+    monkeypatch.setattr(email.smtplib, "SMTP", FakeSMTP)
+    return FakeSMTP.instances
+
+
+@pytest.fixture
+def report(
+    expired_credential: Credential, default_thresholds: ExpirationThresholds
+) -> ExpirationReport:
+    """Report with one expired credential."""
+    return ExpirationAnalyzer(default_thresholds).analyze([expired_credential])
+
+
+def _sender() -> EmailNotificationSender:
+    return EmailNotificationSender(
+        EmailConfig(
+            enabled=True,
+            server="smtp.example.com",
+            username="user",
+            password="secret",
+            from_address="from@example.com",
+            to_addresses="a@example.com, b@example.com",
+        )
+    )
+
+
+class TestEmailNotificationSender:
+    """Tests for EmailNotificationSender."""
+
+    def test_not_configured_without_recipients(self) -> None:
+        """Sender should not be configured when to_addresses lists no address."""
+        config = EmailConfig(
+            enabled=True,
+            server="smtp.example.com",
+            from_address="from@example.com",
+            to_addresses=" , ",
+        )
+        assert EmailNotificationSender(config).is_configured() is False
+
+    async def test_reuses_connection_across_sends(
+        self, fake_smtp: list[FakeSMTP], report: ExpirationReport
+    ) -> None:
+        """Consecutive sends should share one connection and login."""
+        sender = _sender()
+
+        assert await sender.send(report) is True
+        assert await sender.send(report) is True
+
+        assert len(fake_smtp) == 1
+        assert fake_smtp[0].logins == 1
+        assert [to for _, to, _ in fake_smtp[0].sent] == [("a@example.com", "b@example.com")] * 2
+
+    async def test_reconnects_after_disconnect(
+        self, fake_smtp: list[FakeSMTP], report: ExpirationReport
+    ) -> None:
+        """A dropped connection should be replaced on the next send."""
+        sender = _sender()
+        await sender.send(report)
+        fake_smtp[0].connected = False
+
+        assert await sender.send(report) is True
+
+        assert len(fake_smtp) == 2
+        assert len(fake_smtp[1].sent) == 1
+
+    async def test_disconnect_during_sendmail_is_not_resent(
+        self, fake_smtp: list[FakeSMTP], report: ExpirationReport
+    ) -> None:
+        """A disconnect after DATA was accepted should not deliver the message twice."""
+        sender = _sender()
+        await sender.send(report)
+        fake_smtp[0].disconnect_after_data = True
+
+        assert await sender.send(report) is False
+
+        assert len(fake_smtp) == 1
+        assert len(fake_smtp[0].sent) == 2
+
+        assert await sender.send(report) is True
+        assert len(fake_smtp) == 2
+        assert len(fake_smtp[1].sent) == 1
+
+    async def test_aclose_quits_connection(
+        self, fake_smtp: list[FakeSMTP], report: ExpirationReport
+    ) -> None:
+        """Closing the sender should quit the persistent connection."""
+        sender = _sender()
+        await sender.send(report)
+
+        await sender.aclose()
+
+        assert fake_smtp[0].connected is False
+
+    def test_message_is_valid_multipart_alternative(self, report: ExpirationReport) -> None:
+        """The hand-built message should parse as text and HTML alternatives."""
+        sender = _sender()
+
+        message = message_from_bytes(sender._build_message(report))
+
+        assert message["Subject"] == format_subject(report)
+        assert message["To"] == "a@example.com, b@example.com"
+        assert message.get_content_type() == "multipart/alternative"
+        text, html = message.get_payload()  # type: ignore[misc]
+        sources = credentials_by_source(report)
+        assert text.get_payload(decode=True).decode() == sender._format_text_body(report, *sources)
+        assert html.get_payload(decode=True).decode() == format_html_body(report, *sources)
+
+    def test_non_ascii_content_is_encoded(
+        self, expired_credential: Credential, default_thresholds: ExpirationThresholds
+    ) -> None:
+        """Non-ASCII content should be encoded so the message stays 7-bit clean."""
+        credential = replace(expired_credential, application_name="Zahlungsdienst Größe")
+        report = ExpirationAnalyzer(default_thresholds).analyze([credential])
+
+        raw = _sender()._build_message(report)
+        text = message_from_bytes(raw).get_payload(0)
+
+        assert raw.isascii()
+        assert "Größe" in text.get_payload(decode=True).decode()  # type: ignore[union-attr]
+
+    def test_html_body_escapes_credential_fields(
+        self, expired_credential: Credential, default_thresholds: ExpirationThresholds
+    ) -> None:
+        """Application and credential names should be HTML escaped."""
+        credential = replace(
+            expired_credential, application_name="<script>", display_name='"R&D" key'
+        )
+        report = ExpirationAnalyzer(default_thresholds).analyze([credential])
+        html = format_html_body(report, *credentials_by_source(report))
+
+        assert "<script>" not in html
+        assert "&lt;script&gt;" in html
+        assert "&quot;R&amp;D&quot; key" in html
@@ -0,0 +1,201 @@
+"""Tests for the Entra ID credential repository."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from src.application.exceptions import CredentialRepositoryError
+from src.domain.value_objects import CredentialSource, CredentialType
+from src.infrastructure.adapters.entra_id import repository
+from src.infrastructure.adapters.entra_id.graph_client import GraphClientConfig
+from src.infrastructure.adapters.entra_id.repository import (
+    EntraIdCredentialRepository,
+    _parse_datetime,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+APP_ID = "11111111-1111-1111-1111-111111111111"
+SP_OBJECT_ID = "22222222-2222-2222-2222-222222222222"
+
+
+def _raw_credential(key_id: str, end: str | None = "2030-01-01T00:00:00Z") -> dict[str, Any]:
+    return {"keyId": key_id, "displayName": f"cred-{key_id[:4]}", "endDateTime": end}
+
+
+class FakeGraphClient:
+    """Graph client returning canned applications and service principals."""
+
+    def __init__(self) -> None:
+        self.applications = [
+            {
+                "appId": APP_ID,
+                "displayName": "App",
+                "passwordCredentials": [
+                    _raw_credential("aaaaaaaa-0000-0000-0000-000000000001"),
+                    _raw_credential("aaaaaaaa-0000-0000-0000-000000000002", end=None),
+                ],
+                "keyCredentials": [_raw_credential("aaaaaaaa-0000-0000-0000-000000000003")],
+            },
+            {"appId": APP_ID, "displayName": "No credentials"},
+        ]
+        self.service_principals = [
+            {
+                "id": SP_OBJECT_ID,
+                "appId": APP_ID,
+                "displayName": "SP",
+                "keyCredentials": [_raw_credential("bbbbbbbb-0000-0000-0000-000000000001")],
+            },
+        ]
+        self.events: list[str] = []
+
+    async def iter_applications(self) -> AsyncIterator[list[dict[str, Any]]]:
+        # One application per page to exercise pagination
+        for app in self.applications:
+            await asyncio.sleep(0)
+            self.events.append("application page")
+            yield [app]
+
+    async def iter_service_principals(self) -> AsyncIterator[list[dict[str, Any]]]:
+        self.events.append("service principal page")
+        yield self.service_principals
+
+
+def _repository(*, monitor_service_principals: bool = True) -> EntraIdCredentialRepository:
+    repository = EntraIdCredentialRepository(
+        GraphClientConfig(tenant_id="tenant", client_id="client", client_secret="secret"),
+        monitor_service_principals=monitor_service_principals,
+    )
+    repository._client = FakeGraphClient()  # type: ignore[assignment]
+    return repository
+
+
+class TestParseDatetime:
+    """Tests for Graph API datetime parsing."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("2026-03-01T12:30:45Z", datetime(2026, 3, 1, 12, 30, 45, tzinfo=UTC)),
+            (
+                "2026-03-01T12:30:45.1234567Z",
+                datetime(2026, 3, 1, 12, 30, 45, 123456, tzinfo=UTC),
+            ),
+            ("2026-03-01T12:30:45.5Z", datetime(2026, 3, 1, 12, 30, 45, 500000, tzinfo=UTC)),
+            ("9999-12-31T23:59:59Z", datetime(9999, 12, 31, 23, 59, 59, tzinfo=UTC)),
+            ("2026-03-01T12:30:45+00:00", datetime(2026, 3, 1, 12, 30, 45, tzinfo=UTC)),
+            ("2026-03-01T12:30:45", datetime(2026, 3, 1, 12, 30, 45, tzinfo=UTC)),
+        ],
+    )
+    def test_parses_graph_formats(self, value: str, expected: datetime) -> None:
+        """Graph API timestamps should parse to timezone-aware datetimes."""
+        result = _parse_datetime(value)
+
+        assert result == expected
+        assert result is not None
+        assert result.tzinfo is not None
+
+    @pytest.mark.parametrize(
+        ("value", "microsecond"),
+        [
+            ("2026-03-01T12:30:45Z", 0),
+            ("2026-03-01T12:30:45.5Z", 500000),
+            ("2026-03-01T12:30:45.607Z", 607000),
+            ("2026-03-01T12:30:45.1234567Z", 123456),
+        ],
+    )
+    def test_graph_format_uses_fast_path(
+        self, monkeypatch: pytest.MonkeyPatch, value: str, microsecond: int
+    ) -> None:
+        """Graph's "Z" timestamps should parse without falling back to fromisoformat."""
+
+        class NoFallbackDatetime(datetime):
+            @classmethod
+            def fromisoformat(cls, date_string: str) -> NoFallbackDatetime:
+                msg = f"fast path not taken for {date_string}"
+                raise AssertionError(msg)
+
+        monkeypatch.setattr(repository, "datetime", NoFallbackDatetime)
+        repository._parse_iso_datetime.cache_clear()
+
+        result = _parse_datetime(value)
+        repository._parse_iso_datetime.cache_clear()
+
+        assert result == datetime(2026, 3, 1, 12, 30, 45, microsecond, tzinfo=UTC)
+
+    def test_invalid_value_returns_none(self) -> None:
+        """Unparseable values should return None instead of raising."""
+        assert _parse_datetime("not-a-date") is None
+        assert _parse_datetime("2026-13-01T12:30:45Z") is None
+
+    @pytest.mark.parametrize(
+        "value",
+        ["+026-03-01T12:30:45Z", "2026-03-01T 1:30:45Z", "2026-03-01T12:30:4_5Z"],
+    )
+    def test_rejects_non_digit_fields(self, value: str) -> None:
+        """Signs, spaces and underscores should not slip through the fast path."""
+        assert _parse_datetime(value) is None
+
+    def test_warns_for_every_invalid_value(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Repeated bad values should be logged each time despite the parse cache."""
+        with caplog.at_level(logging.WARNING):
+            _parse_datetime("not-a-date")
+            _parse_datetime("not-a-date")
+
+        assert [r.getMessage() for r in caplog.records] == [
+            "Failed to parse datetime: not-a-date"
+        ] * 2
+
+
+class TestEntraIdCredentialRepository:
+    """Tests for mapping Graph API payloads to credentials."""
+
+    async def test_maps_application_and_service_principal_credentials(self) -> None:
+        """Secrets and certificates from both sources should be mapped."""
+        credentials = await _repository().get_all_credentials()
+
+        assert [(c.source, c.credential_type) for c in credentials] == [
+            (CredentialSource.APP_REGISTRATION, CredentialType.PASSWORD),
+            (CredentialSource.APP_REGISTRATION, CredentialType.CERTIFICATE),
+            (CredentialSource.SERVICE_PRINCIPAL, CredentialType.CERTIFICATE),
+        ]
+        assert str(credentials[-1].object_id) == SP_OBJECT_ID
+        assert {c.application_name for c in credentials} == {"App", "SP"}
+
+    async def test_skips_service_principals_when_disabled(self) -> None:
+        """Service principals should not be fetched when monitoring is disabled."""
+        credentials = await _repository(monitor_service_principals=False).get_all_credentials()
+
+        assert {c.source for c in credentials} == {CredentialSource.APP_REGISTRATION}
+
+    async def test_fetches_service_principals_concurrently(self) -> None:
+        """Service principals should be fetched while app registrations are still streaming."""
+        repository = _repository()
+
+        await repository.get_all_credentials()
+
+        events = repository._client.events  # type: ignore[attr-defined]
+        assert events.index("service principal page") < len(events) - 1
+
+    async def test_service_principal_failure_stops_stream_early(self) -> None:
+        """A service principal error should surface before every app page is consumed."""
+        repository = _repository()
+        client = repository._client
+        client.applications = client.applications * 5  # type: ignore[attr-defined]
+
+        async def failing_service_principals() -> AsyncIterator[list[dict[str, Any]]]:
+            raise RuntimeError("Graph unavailable")
+            yield []
+
+        client.iter_service_principals = failing_service_principals  # type: ignore[method-assign]
+
+        with pytest.raises(CredentialRepositoryError, match="Graph unavailable"):
+            await repository.get_all_credentials()
+
+        assert client.events.count("application page") < 10  # type: ignore[attr-defined]
@@ -0,0 +1,112 @@
+"""Tests for the Microsoft Graph API client."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import httpx
+import orjson
+import pytest
+
+from src.infrastructure.adapters.entra_id.graph_client import GraphClient, GraphClientConfig
+
+if TYPE_CHECKING:
+    from tests.conftest import FakeMsalApp
+
+
+def _client(msal_app: FakeMsalApp) -> GraphClient:
+    client = GraphClient(
+        GraphClientConfig(tenant_id="tenant", client_id="client", client_secret="secret")
+    )
+    client._msal_app = msal_app  # type: ignore[assignment]
+    return client
+
+
+class TestGraphClientToken:
+    """Tests for access token handling."""
+
+    @pytest.mark.parametrize("fake_msal_app", [0.05], indirect=True)
+    async def test_concurrent_callers_share_one_acquisition(
+        self, fake_msal_app: FakeMsalApp
+    ) -> None:
+        """Concurrent token requests should result in a single MSAL call."""
+        client = _client(fake_msal_app)
+
+        tokens = await asyncio.gather(*(client._acquire_token() for _ in range(5)))
+
+        assert tokens == ["token-1"] * 5
+        assert fake_msal_app.calls == 1
+
+    async def test_keep_token_fresh_acquires_in_background(
+        self, fake_msal_app: FakeMsalApp
+    ) -> None:
+        """The background refresher should acquire a token before any request needs it."""
+        client = _client(fake_msal_app)
+
+        task = asyncio.create_task(client.keep_token_fresh())
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        assert fake_msal_app.calls == 1
+        assert await client._acquire_token() == "token-1"
+        assert fake_msal_app.calls == 1
+
+
+class TestGraphClientPagination:
+    """Tests for paginated collection reads."""
+
+    async def test_prefetches_next_page_while_caller_processes(
+        self, fake_msal_app: FakeMsalApp
+    ) -> None:
+        """The next page should be requested before the caller finishes the current one."""
+        events: list[str] = []
+        pages = {
+            "/v1.0/applications": {"value": [1], "@odata.nextLink": "https://graph/page2"},
+            "/page2": {"value": [2]},
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            events.append(f"request {request.url.path}")
+            return httpx.Response(200, content=orjson.dumps(pages[request.url.path]))
+
+        client = _client(fake_msal_app)
+        client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        results = []
+        async for page in client._iter_pages("/applications"):
+            await asyncio.sleep(0.01)
+            events.append(f"processed {page}")
+            results.extend(page)
+
+        assert results == [1, 2]
+        assert events == [
+            "request /v1.0/applications",
+            "request /page2",
+            "processed [1]",
+            "processed [2]",
+        ]
+
+    async def test_closing_early_waits_for_cancelled_prefetch(
+        self, fake_msal_app: FakeMsalApp
+    ) -> None:
+        """Closing the iterator should cancel and await the in-flight prefetch."""
+        page2_started = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/page2":
+                page2_started.set()
+                await asyncio.Event().wait()
+            return httpx.Response(
+                200, content=orjson.dumps({"value": [1], "@odata.nextLink": "https://graph/page2"})
+            )
+
+        client = _client(fake_msal_app)
+        client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        pages = client._iter_pages("/applications")
+        assert await anext(pages) == [1]
+        await page2_started.wait()
+        await pages.aclose()
+
+        assert asyncio.all_tasks() == {asyncio.current_task()}
@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+from typing import TYPE_CHECKING
+
 import pytest
 
+from src.domain.entities import ExpirationReport
+from src.domain.services import ExpirationAnalyzer
+from src.infrastructure.adapters.notifications import email_format
 from src.infrastructure.adapters.notifications.graph_email import (
     GraphEmailConfig,
     GraphEmailNotificationSender,
 )
 
+if TYPE_CHECKING:
+    from src.domain.entities import Credential
+    from src.domain.value_objects import ExpirationThresholds
+    from tests.conftest import FakeMsalApp
+
 
 class TestGraphEmailConfig:
     """Tests for GraphEmailConfig."""
@@ -124,3 +135,62 @@ class TestGraphEmailNotificationSender:
         )
         sender = GraphEmailNotificationSender(config)
         assert sender.is_configured() is True
+
+    async def test_reuses_http_client_until_closed(self) -> None:
+        """Sends should share one pooled HTTP client until the sender is closed."""
+        sender = GraphEmailNotificationSender(GraphEmailConfig())
+        client = sender._get_http_client()
+
+        assert sender._get_http_client() is client
+
+        await sender.aclose()
+
+        assert client.is_closed
+        assert sender._get_http_client() is not client
+        await sender.aclose()
+
+    def test_message_recipients_are_trimmed(self, default_thresholds: ExpirationThresholds) -> None:
+        """Recipients should be split, trimmed and blank entries dropped."""
+        config = GraphEmailConfig(
+            enabled=True,
+            tenant_id="tenant-id",
+            client_id="client-id",
+            client_secret="client-secret",
+            from_address="notifications@example.com",
+            to_addresses=" admin@example.com, ,ops@example.com ",
+        )
+        sender = GraphEmailNotificationSender(config)
+
+        message = sender._build_message(
+            ExpirationReport(credentials=[], thresholds=default_thresholds)
+        )
+
+        assert [r["emailAddress"]["address"] for r in message["message"]["toRecipients"]] == [
+            "admin@example.com",
+            "ops@example.com",
+        ]
+
+    @pytest.mark.parametrize("fake_msal_app", [0.05], indirect=True)
+    async def test_concurrent_sends_share_one_token(self, fake_msal_app: FakeMsalApp) -> None:
+        """Concurrent token requests should result in a single MSAL call."""
+        sender = GraphEmailNotificationSender(GraphEmailConfig())
+        sender._msal_app = fake_msal_app  # type: ignore[assignment]
+
+        tokens = await asyncio.gather(*(sender._acquire_token() for _ in range(5)))
+
+        assert tokens == ["token-1"] * 5
+        assert fake_msal_app.calls == 1
+
+    def test_message_uses_shared_email_formatting(
+        self, expired_credential: Credential, default_thresholds: ExpirationThresholds
+    ) -> None:
+        """Subject and body should come from the formatting shared with the SMTP sender."""
+        report = ExpirationAnalyzer(default_thresholds).analyze([expired_credential])
+        sender = GraphEmailNotificationSender(GraphEmailConfig())
+
+        message = sender._build_message(report)["message"]
+
+        assert message["subject"] == email_format.format_subject(report)
+        assert message["body"]["content"] == email_format.format_html_body(
+            report, *email_format.credentials_by_source(report)
+        )
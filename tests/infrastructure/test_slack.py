@@ -0,0 +1,46 @@
+"""Tests for Slack notification sender."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from src.domain.services import ExpirationAnalyzer
+from src.domain.value_objects import CredentialSource
+from src.infrastructure.adapters.notifications.slack import SlackConfig, SlackNotificationSender
+
+if TYPE_CHECKING:
+    from src.domain.entities import Credential
+    from src.domain.value_objects import ExpirationThresholds
+
+
+class TestSlackNotificationSender:
+    """Tests for SlackNotificationSender."""
+
+    def test_skips_sources_without_attention_credentials(
+        self,
+        expired_credential: Credential,
+        healthy_credential: Credential,
+        default_thresholds: ExpirationThresholds,
+    ) -> None:
+        """Sources with only healthy credentials should not get a section."""
+        # Beyond the warning threshold but within the info threshold, so it is reported
+        service_principal = replace(
+            healthy_credential,
+            expiry_date=datetime.now(UTC) + timedelta(days=60),
+            source=CredentialSource.SERVICE_PRINCIPAL,
+        )
+        report = ExpirationAnalyzer(default_thresholds).analyze(
+            [expired_credential, service_principal]
+        )
+        sender = SlackNotificationSender(SlackConfig(enabled=True, webhook_url="https://hook"))
+
+        texts = [
+            block["text"]["text"]
+            for block in sender._build_slack_message(report)["blocks"]
+            if "text" in block
+        ]
+
+        assert "*📦 APP REGISTRATIONS*" in texts
+        assert "*🔧 SERVICE PRINCIPALS*" not in texts
@@ -0,0 +1,104 @@
+"""Tests for generic webhook notification sender."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import httpx
+import orjson
+
+from src.domain.services import ExpirationAnalyzer
+from src.domain.value_objects import CredentialSource
+from src.infrastructure.adapters.notifications.webhook import (
+    WebhookConfig,
+    WebhookNotificationSender,
+)
+
+if TYPE_CHECKING:
+    from src.domain.entities import Credential
+    from src.domain.value_objects import ExpirationThresholds
+
+
+class TestWebhookNotificationSender:
+    """Tests for WebhookNotificationSender."""
+
+    async def test_sends_json_payload_through_shared_client(
+        self, expired_credential: Credential, default_thresholds: ExpirationThresholds
+    ) -> None:
+        """Sends should post the JSON payload through the sender's pooled client."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(204)
+
+        report = ExpirationAnalyzer(default_thresholds).analyze([expired_credential])
+        sender = WebhookNotificationSender(WebhookConfig(enabled=True, url="https://hook/alert"))
+        sender._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        assert await sender.send(report) is True
+        assert await sender.send(report) is True
+        await sender.aclose()
+
+        assert len(requests) == 2
+        assert requests[0].headers["content-type"] == "application/json"
+        payload = orjson.loads(requests[0].content)
+        assert payload["event_type"] == "entra_id_secrets_alert"
+        assert payload["credentials"][0]["credential_id"] == str(expired_credential.id)
+
+    def test_payload_lists_share_formatted_credentials(
+        self,
+        expired_credential: Credential,
+        warning_credential: Credential,
+        default_thresholds: ExpirationThresholds,
+    ) -> None:
+        """Source lists and the legacy list should carry the same credential entries."""
+        service_principal = replace(warning_credential, source=CredentialSource.SERVICE_PRINCIPAL)
+        report = ExpirationAnalyzer(default_thresholds).analyze(
+            [service_principal, expired_credential]
+        )
+        sender = WebhookNotificationSender(WebhookConfig(enabled=True, url="https://hook/alert"))
+
+        payload = sender._build_payload(report)
+
+        legacy = payload["credentials"]
+        assert [c["status"] for c in legacy] == ["expired", "warning"]
+        assert payload["app_registrations"]["credentials"] == [legacy[0]]
+        assert payload["service_principals"]["credentials"] == [legacy[1]]
+        assert legacy[1]["source"] == str(CredentialSource.SERVICE_PRINCIPAL)
+
+    def test_payload_timestamp_uses_injected_clock(
+        self, expired_credential: Credential, default_thresholds: ExpirationThresholds
+    ) -> None:
+        """The payload timestamp should come from the configured clock."""
+        report = ExpirationAnalyzer(default_thresholds).analyze([expired_credential])
+        sender = WebhookNotificationSender(
+            WebhookConfig(enabled=True, url="https://hook/alert"),
+            now=lambda: datetime(2026, 3, 1, 8, 0, tzinfo=UTC),
+        )
+
+        assert sender._build_payload(report)["timestamp"] == "2026-03-01T08:00:00+00:00"
+
+    def test_payload_keeps_credentials_sharing_a_key_id(
+        self,
+        expired_credential: Credential,
+        warning_credential: Credential,
+        default_thresholds: ExpirationThresholds,
+    ) -> None:
+        """Credentials sharing a Graph key ID should each keep their own entry."""
+        service_principal = replace(
+            warning_credential, id=expired_credential.id, source=CredentialSource.SERVICE_PRINCIPAL
+        )
+        report = ExpirationAnalyzer(default_thresholds).analyze(
+            [expired_credential, service_principal]
+        )
+        sender = WebhookNotificationSender(WebhookConfig(enabled=True, url="https://hook/alert"))
+
+        payload = sender._build_payload(report)
+
+        assert len(payload["credentials"]) == 2
+        (sp_entry,) = payload["service_principals"]["credentials"]
+        assert sp_entry["source"] == CredentialSource.SERVICE_PRINCIPAL
+        assert sp_entry["status"] == "warning"